@@ -0,0 +1,28 @@
+"""add summary user/agent index
+
+Revision ID: 7c3f1a9d2b64
+Revises: 01cea9899625, 28910db54321
+Create Date: 2026-10-16 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f1a9d2b64'
+down_revision: Union[str, Sequence[str], None] = ('01cea9899625', '28910db54321')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_summary_user_agent_timestamp', 'summary_logs', ['user_id', 'agent', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_summary_user_agent_timestamp', table_name='summary_logs')
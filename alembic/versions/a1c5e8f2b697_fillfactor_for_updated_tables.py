@@ -0,0 +1,44 @@
+"""lower fillfactor on tables updated in place
+
+Revision ID: a1c5e8f2b697
+Revises: f8c2d5e9b413
+Create Date: 2026-10-16 18:20:42.916035
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c5e8f2b697'
+down_revision: Union[str, None] = 'f8c2d5e9b413'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rows here are updated in place (last login, preferences, daily counters)
+UPDATED_TABLES = ('users', 'user_settings', 'usage_stats')
+
+
+def _existing_tables():
+    """UPDATED_TABLES entries present in the database"""
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    return [table for table in UPDATED_TABLES if table in tables]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Free space on each page lets an update that doesn't touch an indexed
+    # column be a HOT update, skipping index writes. Only newly written pages
+    # use the setting; existing pages change when the table is next rewritten
+    # (VACUUM FULL takes an exclusive lock, so it isn't run here)
+    for table in _existing_tables():
+        op.execute(f'ALTER TABLE {table} SET (fillfactor = 70)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _existing_tables():
+        op.execute(f'ALTER TABLE {table} RESET (fillfactor)')
@@ -0,0 +1,28 @@
+"""add partial index for approved relationship lookups
+
+Revision ID: a8d3f1b6c270
+Revises: f3a6d9c2e514
+Create Date: 2026-10-16 15:12:44.208613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f1b6c270'
+down_revision: Union[str, None] = 'f3a6d9c2e514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_relationship_approved_users', 'relationships', ['user_a_id', 'user_b_id'], unique=False, postgresql_where=sa.text('approved = true'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_relationship_approved_users', table_name='relationships')
@@ -0,0 +1,73 @@
+"""maintain updated_at with a trigger
+
+Revision ID: b2e7c4d9a165
+Revises: a8d3f1b6c270
+Create Date: 2026-10-16 15:47:20.381552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7c4d9a165'
+down_revision: Union[str, None] = 'a8d3f1b6c270'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables using TimestampMixin
+TIMESTAMPED_TABLES = (
+    'users',
+    'user_settings',
+    'memory_snapshots',
+    'sessions',
+    'summary_logs',
+    'switch_logs',
+    'media',
+    'milestone_logs',
+    'relationships',
+    'user_feedback',
+    'agent_definitions',
+    'personality_profiles',
+    'user_personality_preferences',
+    'personality_adaptations',
+    'bridge_sessions',
+    'bridge_messages',
+)
+
+
+def _existing_tables():
+    """TIMESTAMPED_TABLES entries that have an updated_at column in the database"""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    return [
+        table for table in TIMESTAMPED_TABLES
+        if table in tables and 'updated_at' in {c['name'] for c in inspector.get_columns(table)}
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in _existing_tables():
+        op.execute(
+            f"CREATE TRIGGER {table}_touch_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION touch_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _existing_tables():
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+    op.execute("DROP FUNCTION touch_updated_at()")
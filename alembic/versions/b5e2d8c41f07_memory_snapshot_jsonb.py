@@ -0,0 +1,45 @@
+"""store memory snapshots as jsonb
+
+Revision ID: b5e2d8c41f07
+Revises: 7c3f1a9d2b64
+Create Date: 2026-10-16 10:03:17.284906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2d8c41f07'
+down_revision: Union[str, None] = '7c3f1a9d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows that aren't valid JSON are kept as JSON strings
+    op.execute("""
+        CREATE FUNCTION _memory_text_to_jsonb(value text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN value::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN to_jsonb(value);
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+    """)
+    op.execute(
+        "ALTER TABLE memory_snapshots ALTER COLUMN summary_text TYPE JSONB "
+        "USING _memory_text_to_jsonb(summary_text)"
+    )
+    op.execute("DROP FUNCTION _memory_text_to_jsonb(text)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "ALTER TABLE memory_snapshots ALTER COLUMN summary_text TYPE TEXT "
+        "USING summary_text::text"
+    )
@@ -0,0 +1,29 @@
+"""store user email as citext
+
+Revision ID: b7d2f4a9c831
+Revises: a1c5e8f2b697
+Create Date: 2026-10-16 18:44:05.327719
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f4a9c831'
+down_revision: Union[str, None] = 'a1c5e8f2b697'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    op.execute('ALTER TABLE users ALTER COLUMN email TYPE citext')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE users ALTER COLUMN email TYPE varchar')
@@ -0,0 +1,33 @@
+"""add gin indexes on media and summary tags
+
+Revision ID: c6f1a8e3d427
+Revises: b2e7c4d9a165
+Create Date: 2026-10-16 16:21:09.554817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1a8e3d427'
+down_revision: Union[str, None] = 'b2e7c4d9a165'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_media_type_tags was declared on media_type, which has no default
+    # gin operator class, so it was never created by a migration
+    op.execute('DROP INDEX IF EXISTS idx_media_type_tags')
+    op.execute('CREATE INDEX IF NOT EXISTS idx_media_tags ON media USING gin (tags array_ops)')
+    op.create_index('idx_summary_tags', 'summary_logs', ['tags'], unique=False, postgresql_using='gin', postgresql_ops={'tags': 'array_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_summary_tags', table_name='summary_logs')
+    op.execute('DROP INDEX IF EXISTS idx_media_tags')
@@ -0,0 +1,89 @@
+"""store id and foreign key columns as native uuid
+
+Revision ID: c9a4f7e2d813
+Revises: b5e2d8c41f07
+Create Date: 2026-10-16 11:42:08.517330
+
+"""
+from typing import Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9a4f7e2d813'
+down_revision: Union[str, None] = 'b5e2d8c41f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Id columns generated by gen_id() and the foreign keys pointing at them
+UUID_COLUMNS: Dict[str, List[str]] = {
+    'users': ['id'],
+    'user_settings': ['user_id'],
+    'memory_snapshots': ['id', 'user_id'],
+    'sessions': ['id', 'user_id'],
+    'summary_logs': ['id', 'user_id', 'related_session_id'],
+    'switch_logs': ['id', 'user_id'],
+    'media': ['id', 'user_id'],
+    'milestone_logs': ['id', 'user_id', 'related_session_id'],
+    'relationships': ['id', 'user_a_id', 'user_b_id'],
+    'user_feedback': ['id', 'user_id', 'related_session_id'],
+    'usage_stats': ['id', 'user_id'],
+    'agent_definitions': ['id', 'personality_profile_id', 'previous_version_id'],
+    'personality_profiles': ['id'],
+    'user_personality_preferences': ['id', 'user_id'],
+    'personality_adaptations': ['id', 'user_id', 'base_profile_id'],
+    'bridge_sessions': ['id', 'initiator_id', 'participant_id'],
+    'bridge_messages': ['id', 'session_id', 'sender_id'],
+}
+
+
+def _convert(column_type: str) -> None:
+    """Change every existing column in UUID_COLUMNS to column_type."""
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+    columns = {
+        (table, column['name'])
+        for table in UUID_COLUMNS if table in existing
+        for column in inspector.get_columns(table)
+        if column['name'] in UUID_COLUMNS[table]
+    }
+
+    # Foreign keys require matching types on both sides, so they are dropped
+    # while the columns change and recreated afterwards
+    foreign_keys = []
+    for table in UUID_COLUMNS:
+        if table not in existing:
+            continue
+        for fk in inspector.get_foreign_keys(table):
+            if any((table, c) in columns for c in fk['constrained_columns']):
+                foreign_keys.append((table, fk))
+                op.drop_constraint(fk['name'], table, type_='foreignkey')
+
+    for table, column in sorted(columns):
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type} '
+            f'USING {column}::{column_type}'
+        )
+
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk['name'],
+            table,
+            fk['referred_table'],
+            fk['constrained_columns'],
+            fk['referred_columns'],
+            ondelete=fk['options'].get('ondelete'),
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert('uuid')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert('varchar')
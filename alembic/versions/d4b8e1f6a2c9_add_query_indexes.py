@@ -0,0 +1,36 @@
+"""add indexes matching memory, milestone and relationship queries
+
+Revision ID: d4b8e1f6a2c9
+Revises: c9a4f7e2d813
+Create Date: 2026-10-16 12:20:55.091862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8e1f6a2c9'
+down_revision: Union[str, None] = 'c9a4f7e2d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Latest snapshot lookups filter on memory_type and order by updated_at;
+    # the new index also covers the (user_id, agent) prefix of the old one
+    op.create_index('idx_memory_user_agent_type_updated', 'memory_snapshots', ['user_id', 'agent', 'memory_type', 'updated_at'], unique=False)
+    op.execute('DROP INDEX IF EXISTS idx_memory_user_agent')
+    op.create_index('idx_milestone_user_timestamp', 'milestone_logs', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_relationship_user_b', 'relationships', ['user_b_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_relationship_user_b', table_name='relationships')
+    op.drop_index('idx_milestone_user_timestamp', table_name='milestone_logs')
+    op.create_index('idx_memory_user_agent', 'memory_snapshots', ['user_id', 'agent'], unique=False)
+    op.drop_index('idx_memory_user_agent_type_updated', table_name='memory_snapshots')
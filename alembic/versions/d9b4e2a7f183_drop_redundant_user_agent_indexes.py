@@ -0,0 +1,44 @@
+"""drop single-column user_id and agent indexes covered by composites
+
+Revision ID: d9b4e2a7f183
+Revises: c6f1a8e3d427
+Create Date: 2026-10-16 16:48:37.102946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b4e2a7f183'
+down_revision: Union[str, None] = 'c6f1a8e3d427'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables using UserRelatedMixin
+USER_RELATED_TABLES = (
+    'memory_snapshots',
+    'sessions',
+    'summary_logs',
+    'milestone_logs',
+    'user_feedback',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in USER_RELATED_TABLES:
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_user_id')
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_agent')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table in USER_RELATED_TABLES:
+        if table in existing:
+            op.create_index(f'ix_{table}_user_id', table, ['user_id'], unique=False)
+            op.create_index(f'ix_{table}_agent', table, ['agent'], unique=False)
@@ -0,0 +1,57 @@
+"""store each relationship's user pair in canonical order
+
+Revision ID: e4a9c7b2f356
+Revises: d9b4e2a7f183
+Create Date: 2026-10-16 17:26:51.839204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9c7b2f356'
+down_revision: Union[str, None] = 'd9b4e2a7f183'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('relationships', sa.Column('user_low', sa.UUID(as_uuid=False), sa.Computed('LEAST(user_a_id, user_b_id)', persisted=True)))
+    op.add_column('relationships', sa.Column('user_high', sa.UUID(as_uuid=False), sa.Computed('GREATEST(user_a_id, user_b_id)', persisted=True)))
+
+    # Mirrored duplicates ((a, b) and (b, a) with the same type) would break
+    # the new unique constraint. Which row to keep is a data decision, so
+    # stop and list them rather than deleting anything here
+    conflicts = op.get_bind().execute(sa.text("""
+        SELECT user_low, user_high, relationship_type, array_agg(id::text ORDER BY id) AS ids
+        FROM relationships
+        GROUP BY user_low, user_high, relationship_type
+        HAVING count(*) > 1
+    """)).all()
+    if conflicts:
+        listing = '\n'.join(
+            f'  {row.relationship_type} between {row.user_low} and {row.user_high}: {", ".join(row.ids)}'
+            for row in conflicts
+        )
+        raise RuntimeError(
+            f'{len(conflicts)} user pairs have more than one relationship of the same type. '
+            f'Remove or merge the duplicates, then run the migration again:\n{listing}'
+        )
+
+    op.execute('ALTER TABLE relationships DROP CONSTRAINT IF EXISTS uix_relationship')
+    op.create_unique_constraint('uix_relationship_pair', 'relationships', ['user_low', 'user_high', 'relationship_type'])
+    op.drop_index('idx_relationship_approved_users', table_name='relationships')
+    op.create_index('idx_relationship_approved_pair', 'relationships', ['user_low', 'user_high'], unique=False, postgresql_where=sa.text('approved = true'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_relationship_approved_pair', table_name='relationships')
+    op.create_index('idx_relationship_approved_users', 'relationships', ['user_a_id', 'user_b_id'], unique=False, postgresql_where=sa.text('approved = true'))
+    op.drop_constraint('uix_relationship_pair', 'relationships', type_='unique')
+    op.drop_column('relationships', 'user_high')
+    op.drop_column('relationships', 'user_low')
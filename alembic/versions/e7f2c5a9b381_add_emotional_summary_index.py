@@ -0,0 +1,28 @@
+"""add partial index for emotional summary reads
+
+Revision ID: e7f2c5a9b381
+Revises: d4b8e1f6a2c9
+Create Date: 2026-10-16 14:05:31.772410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f2c5a9b381'
+down_revision: Union[str, None] = 'd4b8e1f6a2c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_summary_user_emotional_timestamp', 'summary_logs', ['user_id', 'created_at'], unique=False, postgresql_where=sa.text('emotional_tone IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_summary_user_emotional_timestamp', table_name='summary_logs')
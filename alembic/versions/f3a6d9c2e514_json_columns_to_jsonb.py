@@ -0,0 +1,66 @@
+"""store session data, preferences and visibility rules as jsonb
+
+Revision ID: f3a6d9c2e514
+Revises: e7f2c5a9b381
+Create Date: 2026-10-16 14:38:12.640925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6d9c2e514'
+down_revision: Union[str, None] = 'e7f2c5a9b381'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs moving to jsonb
+JSONB_COLUMNS = (
+    ('sessions', 'session_data'),
+    ('user_settings', 'preferences'),
+    ('relationships', 'visibility_rules'),
+)
+
+
+def _existing_columns():
+    """JSONB_COLUMNS entries present in the database"""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    return [
+        (table, column) for table, column in JSONB_COLUMNS
+        if table in tables and column in {c['name'] for c in inspector.get_columns(table)}
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Some of these columns started out as TEXT; values that aren't valid
+    # JSON are kept as JSON strings
+    op.execute("""
+        CREATE FUNCTION _text_to_jsonb(value text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN value::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN to_jsonb(value);
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+    """)
+    for table, column in _existing_columns():
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB "
+            f"USING _text_to_jsonb({column}::text)"
+        )
+    op.execute("DROP FUNCTION _text_to_jsonb(text)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in _existing_columns():
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON "
+            f"USING {column}::json"
+        )
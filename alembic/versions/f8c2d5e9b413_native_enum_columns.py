@@ -0,0 +1,85 @@
+"""store enum columns as native postgres enum types
+
+Revision ID: f8c2d5e9b413
+Revises: e4a9c7b2f356
+Create Date: 2026-10-16 17:58:14.470382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c2d5e9b413'
+down_revision: Union[str, None] = 'e4a9c7b2f356'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Enum types declared by the models and their labels
+ENUM_TYPES = {
+    'userrole': ('individual', 'parent', 'child', 'expert', 'admin'),
+    'milestonetype': ('insight', 'boundary', 'regulation', 'growth'),
+    'relationshiptype': ('parent_child', 'therapist_patient', 'mentor_mentee', 'friend'),
+    'visibilitylevel': ('none', 'summary', 'full', 'custom'),
+    'feedbacktype': ('session', 'suggestion', 'bug', 'feature'),
+    'agenttype': (
+        'therapist', 'coach', 'parent', 'friend', 'bridge', 'system',
+        'assistant', 'expert', 'critic', 'creative', 'mediator',
+    ),
+    'bridgestatus': ('pending', 'active', 'paused', 'completed', 'rejected'),
+    'communicationstyle': (
+        'SOCRATIC', 'INSTRUCTIVE', 'COLLABORATIVE', 'COACHING',
+        'TECHNICAL', 'ACCESSIBLE', 'NARRATIVE', 'METHODICAL',
+    ),
+    'emotionaltone': (
+        'NEUTRAL', 'ENTHUSIASTIC', 'CALM', 'ENCOURAGING',
+        'REASSURING', 'AUTHORITATIVE', 'FRIENDLY', 'PROFESSIONAL',
+    ),
+}
+
+# (table, column) -> enum type
+ENUM_COLUMNS = {
+    ('users', 'role'): 'userrole',
+    ('milestone_logs', 'milestone_type'): 'milestonetype',
+    ('relationships', 'relationship_type'): 'relationshiptype',
+    ('relationships', 'visibility_level'): 'visibilitylevel',
+    ('user_feedback', 'feedback_type'): 'feedbacktype',
+    ('agent_definitions', 'type'): 'agenttype',
+    ('personality_adaptations', 'agent_type'): 'agenttype',
+    ('bridge_sessions', 'status'): 'bridgestatus',
+    ('personality_profiles', 'communication_style'): 'communicationstyle',
+    ('personality_profiles', 'emotional_tone'): 'emotionaltone',
+    ('user_personality_preferences', 'communication_style_preference'): 'communicationstyle',
+    ('user_personality_preferences', 'emotional_tone_preference'): 'emotionaltone',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    # Some of these columns were created as VARCHAR by earlier migrations
+    for (table, column), type_name in ENUM_COLUMNS.items():
+        if table not in tables:
+            continue
+        current = {c['name']: c['type'] for c in inspector.get_columns(table)}.get(column)
+        if current is None or isinstance(current, sa.Enum):
+            continue
+        postgresql.ENUM(*ENUM_TYPES[type_name], name=type_name).create(bind, checkfirst=True)
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} '
+            f'USING {column}::text::{type_name}'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Which columns were VARCHAR before isn't recorded; native enums are what
+    # the models declare, so they are left in place
+    pass
@@ -121,7 +121,7 @@ class ContextWindowManager:
         self.model_name = model_name
         self.max_tokens = max_tokens or TOKEN_LIMITS.get(model_name, DEFAULT_TOKEN_LIMIT)
         self.buffer_tokens = buffer_tokens
-        self.logger = get_logger(__name__)
+        self.logger = logger
         
         # Calculate effective token limit (reserving buffer for response)
         self.effective_limit = self.max_tokens - self.buffer_tokens
@@ -221,7 +221,7 @@ class MemoryAccessManager:
     
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.logger = get_logger(__name__)
+        self.logger = logger
     
     async def handle_memory_request(self, message: AgentMessage) -> AgentMessage:
         """
@@ -531,20 +531,15 @@ class MemoryAccessManager:
         if path == "all":
             return memory
         else:
-            # Try to navigate path in memory
-            try:
-                import json
-                memory_dict = json.loads(memory) if isinstance(memory, str) else memory
-                parts = path.split('.')
-                current = memory_dict
-                for part in parts:
-                    if part in current:
-                        current = current[part]
-                    else:
-                        return None
-                return current
-            except (json.JSONDecodeError, AttributeError, KeyError):
-                return None
+            # Navigate path in memory; summary_text is JSONB, so the driver
+            # has already decoded it and there is no string to parse
+            current = memory
+            for part in path.split('.'):
+                if isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    return None
+            return current
     
     async def _read_session_memory(
         self,
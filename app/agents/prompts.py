@@ -503,7 +503,7 @@ class PromptManager:
             agent_name: Name of the agent this manager is for
         """
         self.agent_name = agent_name
-        self.logger = get_logger(__name__)
+        self.logger = logger
     
     def get_system_prompt(self) -> str:
         """
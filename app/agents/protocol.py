@@ -8,7 +8,7 @@ It includes message structures, request/response formats, and serialization meth
 from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 
 # Agent communication message types
 class MessageType(str, Enum):
@@ -35,8 +35,8 @@ class EmotionalState(BaseModel):
     secondary: Optional[List[Dict[str, float]]] = Field(None, description="Secondary emotions with intensities")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence in emotion detection (0-1)")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "primary": "joy",
                 "intensity": 0.8,
@@ -47,6 +47,7 @@ class EmotionalState(BaseModel):
                 "confidence": 0.9
             }
         }
+    )
 
 class AgentCapability(str, Enum):
     """Capabilities that agents can advertise and request"""
@@ -78,8 +79,8 @@ class AgentMessage(BaseModel):
     requires_response: bool = Field(default=False, description="Whether this message requires a response")
     ttl: Optional[int] = Field(None, description="Time to live in seconds (for expiring messages)")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "msg_123456789",
                 "type": "query",
@@ -98,6 +99,7 @@ class AgentMessage(BaseModel):
                 "ttl": 30
             }
         }
+    )
 
 class MemoryAccessRequest(BaseModel):
     """Request to access or modify agent memory"""
@@ -107,8 +109,8 @@ class MemoryAccessRequest(BaseModel):
     data: Optional[Any] = Field(None, description="Data for write/update operations")
     filters: Optional[Dict[str, Any]] = Field(None, description="Filters for read operations")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "operation": "read",
                 "memory_type": "emotional_state",
@@ -116,6 +118,7 @@ class MemoryAccessRequest(BaseModel):
                 "filters": {"since": "2023-05-01T00:00:00Z"}
             }
         }
+    )
 
 class AgentHandoff(BaseModel):
     """Data model for handing off a conversation to another agent"""
@@ -127,8 +130,8 @@ class AgentHandoff(BaseModel):
     emotional_state: Optional[EmotionalState] = Field(None, description="Current emotional state assessment")
     urgency: MessagePriority = Field(default=MessagePriority.NORMAL, description="Urgency of the handoff")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "target_agent": "Therapist",
                 "reason": "User showing signs of distress that require therapeutic approach",
@@ -150,6 +153,7 @@ class AgentHandoff(BaseModel):
                 "urgency": "high"
             }
         }
+    )
 
 class AgentThought(BaseModel):
     """Internal thought process of an agent, not shown to the user"""
@@ -159,8 +163,8 @@ class AgentThought(BaseModel):
     next_steps: List[str] = Field(..., description="Potential next steps")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence in this assessment")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reasoning": "User's short responses and mentions of avoiding social situations suggest possible anxiety",
                 "observations": [
@@ -182,6 +186,7 @@ class AgentThought(BaseModel):
                 "confidence": 0.75
             }
         }
+    )
 
 # Protocol utility functions
 def create_message(
@@ -267,7 +272,7 @@ def create_handoff_message(
         message_type=MessageType.HANDOFF,
         sender=sender,
         recipient=target_agent,
-        content=handoff.dict(),
+        content=handoff.model_dump(),
         session_id=session_id,
         user_id=user_id,
         priority=kwargs.get('priority', MessagePriority.HIGH),
@@ -315,7 +320,7 @@ def create_memory_request(
         sender=sender,
         # Memory requests always go to the Memory Service
         recipient="MemoryService",
-        content=memory_request.dict(),
+        content=memory_request.model_dump(),
         session_id=session_id,
         user_id=user_id,
         requires_response=True,
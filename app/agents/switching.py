@@ -101,7 +101,7 @@ class SwitchingEngine:
     
     def __init__(self, default_agent: str = "EchoMind"):
         self.default_agent = default_agent
-        self.logger = get_logger(__name__)
+        self.logger = logger
     
     def evaluate_emotional_state(self, emotional_state: EmotionalState) -> Optional[str]:
         """
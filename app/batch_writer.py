@@ -0,0 +1,194 @@
+"""
+Batched Insert Module
+
+This module buffers single-row inserts from high-volume logging endpoints and
+writes them to the database in batches from a background task.
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.cache import ADMIN_STATS_KEY, response_cache
+from app.database import AsyncSessionLocal, is_db_unavailable
+from app.logging_config import get_logger, request_id_ctx
+from app.models import MilestoneLog, SessionLog, gen_ids
+
+logger = get_logger(__name__)
+
+# Batching limits
+INSERT_BATCH_SIZE = int(os.getenv("INSERT_BATCH_SIZE", "100"))
+INSERT_BATCH_WINDOW = float(os.getenv("INSERT_BATCH_WINDOW_MS", "10")) / 1000
+INSERT_QUEUE_SIZE = int(os.getenv("INSERT_QUEUE_SIZE", "1024"))
+
+# Retries of a whole batch while the database is unreachable, with
+# exponential backoff starting at INSERT_RETRY_DELAY seconds
+INSERT_RETRY_ATTEMPTS = int(os.getenv("INSERT_RETRY_ATTEMPTS", "3"))
+INSERT_RETRY_DELAY = float(os.getenv("INSERT_RETRY_DELAY", "1"))
+
+# Queue marker telling the worker to flush and exit
+_STOP = object()
+
+class InsertBatcher:
+    """Queue rows for one table and insert them with a single executemany per batch"""
+
+    def __init__(self, model, on_flush: Optional[Callable[[], None]] = None):
+        """
+        Initialize the batcher.
+
+        Args:
+            model: SQLAlchemy model whose table receives the rows
+            on_flush: Optional callback run after each successful batch
+        """
+        self.model = model
+        self.on_flush = on_flush
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def put(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row for insertion, waiting if the queue is full.
+
+        Args:
+            row: Column values for the new row
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=INSERT_QUEUE_SIZE)
+            self._worker = asyncio.create_task(self._run())
+
+        await self._queue.put(row)
+
+    async def stop(self) -> None:
+        """Write any queued rows and stop the background task"""
+        if self._worker is None:
+            return
+
+        if not self._worker.done():
+            # Don't wait out retries during shutdown
+            self._stopping = True
+            await self._queue.put(_STOP)
+            await self._worker
+        self._worker = None
+        self._stopping = False
+
+    async def _run(self):
+        """
+        Collect queued rows into batches and insert them
+
+        A batch closes when it reaches INSERT_BATCH_SIZE rows or
+        INSERT_BATCH_WINDOW has passed since its first row.
+        """
+        loop = asyncio.get_running_loop()
+        # The worker outlives the request that started it; don't tag its logs
+        # with that request's ID
+        request_id_ctx.set(None)
+
+        while True:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+
+            rows = [row]
+            stopping = False
+            deadline = loop.time() + INSERT_BATCH_WINDOW
+
+            while len(rows) < INSERT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            # Assign the batch's ids in one go rather than per row via the
+            # column default
+            for row, new_id in zip(rows, gen_ids(len(rows)), strict=True):
+                row.setdefault("id", new_id)
+
+            await self._flush_with_retry(rows)
+            if stopping:
+                return
+
+    async def _flush_with_retry(self, rows: List[Dict[str, Any]]):
+        """
+        Insert a batch of rows, retrying the whole batch with backoff while
+        the database is unreachable
+
+        After INSERT_RETRY_ATTEMPTS failed retries (or straight away during
+        shutdown) the batch is dropped, so an outage can't stall the worker
+        indefinitely.
+
+        Args:
+            rows: Column values for each row
+        """
+        table = self.model.__tablename__
+        delay = INSERT_RETRY_DELAY
+        for attempt in range(INSERT_RETRY_ATTEMPTS + 1):
+            try:
+                await self._flush(rows)
+                return
+            except Exception as e:
+                if not is_db_unavailable(e) or attempt == INSERT_RETRY_ATTEMPTS or self._stopping:
+                    logger.error(
+                        f"Dropped batch of {len(rows)} queued {table} rows: {str(e)}",
+                        extra={"table": table, "rows": len(rows)}
+                    )
+                    return
+                logger.warning(
+                    f"Database unavailable for {table} batch, retrying in {delay}s: {str(e)}",
+                    extra={"table": table, "rows": len(rows)}
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _flush(self, rows: List[Dict[str, Any]]):
+        """
+        Insert a batch of rows
+
+        If the batch is rejected (e.g. one row references a missing user),
+        the rows are retried one at a time so a single bad row doesn't drop
+        the rest of the batch. Other errors, such as the database being
+        unreachable, are raised for the caller to handle.
+
+        Args:
+            rows: Column values for each row
+        """
+        table = self.model.__tablename__
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(self.model), rows)
+                await db.commit()
+        except (IntegrityError, DataError) as e:
+            if len(rows) == 1:
+                logger.error(f"Dropped queued {table} row: {str(e)}", extra={"table": table})
+                return
+            logger.warning(
+                f"Batch insert into {table} failed, retrying rows individually: {str(e)}",
+                extra={"table": table, "rows": len(rows)}
+            )
+            for row in rows:
+                await self._flush([row])
+            return
+
+        if self.on_flush is not None:
+            self.on_flush()
+
+# Batchers for the logging endpoints
+session_log_batcher = InsertBatcher(SessionLog)
+milestone_log_batcher = InsertBatcher(
+    MilestoneLog,
+    on_flush=lambda: response_cache.delete(ADMIN_STATS_KEY)
+)
+
+async def stop_batchers() -> None:
+    """Write out all queued rows; called on application shutdown"""
+    await asyncio.gather(session_log_batcher.stop(), milestone_log_batcher.stop())
@@ -0,0 +1,120 @@
+"""
+Response Cache Module
+
+This module provides a bounded in-memory TTL cache for read-heavy endpoints.
+"""
+
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Cache keys and lifetimes for cached endpoints
+ADMIN_STATS_KEY = "admin_stats"
+ADMIN_STATS_TTL = 30
+EMOTION_SUMMARY_TTL = 60
+MEMORY_SNAPSHOT_TTL = 60
+
+class TTLCache:
+    """In-memory cache with per-entry expiry and least-recently-used eviction"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Default time to live for entries, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (default: the cache's ttl)
+        """
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a value from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values"""
+        self._entries.clear()
+
+# Emotional memory reads are cached per (agent, limit) variant. Variant keys
+# include a per-user generation, so a write invalidates every variant by
+# dropping the generation; the next read starts a new one. Generations come
+# from a process-wide counter, so one is never reused after eviction.
+_emotion_generations = itertools.count()
+
+def _emotion_generation_key(user_id: str) -> tuple:
+    return ("emotion_generation", user_id)
+
+def emotion_summary_key(user_id: str, agent: Optional[str], limit: int) -> Optional[tuple]:
+    """
+    Cache key for one agent/limit variant of a user's emotional memory
+    summaries, or None if nothing is cached for the user
+    """
+    generation = response_cache.get(_emotion_generation_key(user_id))
+    if generation is None:
+        return None
+    return ("emotion", user_id, generation, agent, limit)
+
+def cache_emotion_summaries(user_id: str, agent: Optional[str], limit: int, value: Any) -> None:
+    """Cache one agent/limit variant of a user's emotional memory summaries"""
+    generation_key = _emotion_generation_key(user_id)
+    generation = response_cache.get(generation_key)
+    if generation is None:
+        generation = next(_emotion_generations)
+        response_cache.set(generation_key, generation, ttl=EMOTION_SUMMARY_TTL)
+    response_cache.set(("emotion", user_id, generation, agent, limit), value, ttl=EMOTION_SUMMARY_TTL)
+
+def invalidate_emotion_summaries(user_id: str) -> None:
+    """Drop every cached emotional memory variant for a user"""
+    response_cache.delete(_emotion_generation_key(user_id))
+
+def memory_snapshot_key(user_id: str, agent: str, memory_type: str) -> tuple:
+    """Cache key for a user's latest memory snapshot for an agent"""
+    return ("memory", user_id, agent, memory_type)
+
+# Shared response cache instance
+response_cache = TTLCache(maxsize=10_000, ttl=ADMIN_STATS_TTL)
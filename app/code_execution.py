@@ -11,7 +11,7 @@ def execute_python_code(code: str, context: Dict[str, Any] = None) -> Dict[str,
     if context is None:
         context = {}
         
-    start_time = time.time()
+    start_time = time.perf_counter()
     stdout = io.StringIO()
     stderr = io.StringIO()
     exec_globals = {**context}
@@ -41,6 +41,6 @@ def execute_python_code(code: str, context: Dict[str, Any] = None) -> Dict[str,
         result["stderr"] = stderr.getvalue()
         
     finally:
-        result["execution_time"] = time.time() - start_time
+        result["execution_time"] = time.perf_counter() - start_time
         
     return result
@@ -1,13 +1,16 @@
+import asyncio
 import os
 import uuid
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import bindparam, or_
+from sqlalchemy.exc import InterfaceError, OperationalError, SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.future import select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import raiseload
 from sqlalchemy.sql import Select
-from contextlib import asynccontextmanager
 
 from app.models import MilestoneLog, Relationship, SessionLog, SummaryLog, User
 
@@ -20,31 +23,103 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL or "+asyncpg" not in DATABASE_URL:
     raise ValueError("DATABASE_URL must use asyncpg driver (postgresql+asyncpg://...)")
 
+# Connection pool sizing (per worker process)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "25"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+
+# Prepared statements kept per connection, so repeated queries skip parse and
+# plan. Set to 0 behind pgbouncer in transaction mode, where a prepared
+# statement can't outlive the transaction's server connection
+STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+
 # Configure async engine with connection pooling
 engine = create_async_engine(
     DATABASE_URL,
     echo=os.getenv("SQL_ECHO", "false").lower() == "true",
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=10,
     pool_recycle=1800,
+    pool_pre_ping=True,
+    # Compiled SQL strings cached across the app's query shapes
+    query_cache_size=1200,
+    connect_args={
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+    },
 )
 
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
+AsyncSessionLocal = async_sessionmaker(
+    engine,
     expire_on_commit=False,
     autoflush=False
 )
 
-@asynccontextmanager
 async def get_db():
     """Provide a database session with proper error handling and cleanup."""
-    db = AsyncSessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        await db.close()
+
+async def warm_pool(size: int = POOL_SIZE) -> List[BaseException]:
+    """
+    Open pooled connections up front so early requests skip the connection handshake.
+    
+    Best effort: connections that can't be opened (e.g. the server's
+    connection limit is lower than the pool size across workers) are left
+    to be opened on demand.
+    
+    Returns:
+        Errors from the connections that couldn't be opened
+    """
+    results = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+    connections = [c for c in results if not isinstance(c, BaseException)]
+    # Closing returns the connections to the pool rather than disconnecting them
+    await asyncio.gather(*(c.close() for c in connections))
+    
+    return [c for c in results if isinstance(c, BaseException)]
+
+# Errors meaning the database couldn't be reached, as opposed to a statement
+# being rejected
+_UNAVAILABLE_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError)
+
+def is_db_unavailable(error: BaseException) -> bool:
+    """Whether error means the database couldn't be reached (so retrying later may succeed)."""
+    return isinstance(error, _UNAVAILABLE_ERRORS)
+
+def db_error_status(error: SQLAlchemyError) -> int:
+    """HTTP status for a database error: 503 if the database is unavailable, else 500."""
+    return 503 if is_db_unavailable(error) else 500
+
+def is_uuid(value: str) -> bool:
+    """
+    Whether value is a well-formed UUID. Id columns are native UUIDs, so a
+    malformed id can't match any row and would be rejected by the database.
+    """
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+USER_EXISTS = select(1).where(User.id == bindparam("user_id"))
+
+async def user_exists(db: AsyncSession, user_id: str) -> bool:
+    """Check whether a user exists without loading the full row."""
+    if not is_uuid(user_id):
+        return False
+    return await db.scalar(USER_EXISTS, {"user_id": user_id}) is not None
+
+# User has many collection relationships; an accidental lazy load on one of
+# them is an extra query per user (and fails outright under asyncio), so user
+# reads raise on any relationship that wasn't loaded explicitly
+USER_LOAD_OPTIONS = (raiseload("*"),)
+
+async def get_user(db: AsyncSession, user_id: str, *options) -> Optional[User]:
+    """
+    Load a user by id. Relationships needed by the caller must be passed as
+    loader options, e.g. get_user(db, user_id, selectinload(User.settings)).
+    """
+    return await db.get(User, user_id, options=[*options, *USER_LOAD_OPTIONS])
 
 def serialize_model(model_instance) -> Dict[str, Any]:
     """Convert SQLAlchemy model to dict, excluding private attributes."""
@@ -76,7 +151,7 @@ async def export_user_data(user_id: str, db: AsyncSession) -> Optional[Dict[str,
     """
     try:
         # Get user record
-        user = await db.get(User, user_id)
+        user = await get_user(db, user_id)
         if not user:
             return None
             
@@ -85,7 +160,9 @@ async def export_user_data(user_id: str, db: AsyncSession) -> Optional[Dict[str,
             "sessions": select(SessionLog).where(SessionLog.user_id == user_id).order_by(SessionLog.created_at.desc()),
             "summaries": select(SummaryLog).where(SummaryLog.user_id == user_id).order_by(SummaryLog.created_at.desc()),
             "milestones": select(MilestoneLog).where(MilestoneLog.user_id == user_id).order_by(MilestoneLog.created_at.desc()),
-            "relationships": select(Relationship).where(Relationship.user_a_id == user_id),
+            "relationships": select(Relationship).where(
+                or_(Relationship.user_a_id == user_id, Relationship.user_b_id == user_id)
+            ),
         }
         
         # Execute all queries and compile results
@@ -93,13 +170,14 @@ async def export_user_data(user_id: str, db: AsyncSession) -> Optional[Dict[str,
             "user": serialize_model(user),
         }
         
-        # Execute all queries concurrently
+        # Run the queries on the caller's session, so an export holds a
+        # single pooled connection and reads within one transaction
         for key, query in queries.items():
             results[key] = await execute_query(db, query)
             
         # Add metadata
         results["metadata"] = {
-            "export_date": datetime.datetime.now().isoformat(),
+            "export_date": datetime.now(),
             "record_counts": {key: len(value) for key, value in results.items() if isinstance(value, list)}
         }
             
@@ -112,7 +190,7 @@ async def export_user_data(user_id: str, db: AsyncSession) -> Optional[Dict[str,
         return {
             "error": str(e),
             "user_id": user_id,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 # Example usage with pagination
@@ -123,7 +201,7 @@ async def export_user_data_paginated(
 ) -> Dict[str, Any]:
     """Export user data with pagination for large datasets."""
     try:
-        user = await db.get(User, user_id)
+        user = await get_user(db, user_id)
         if not user:
             return None
             
@@ -161,7 +239,10 @@ async def export_user_data_paginated(
         
         # Get relationships (typically smaller, no pagination needed)
         results["relationships"] = await execute_query(
-            db, select(Relationship).where(Relationship.user_a_id == user_id)
+            db,
+            select(Relationship).where(
+                or_(Relationship.user_a_id == user_id, Relationship.user_b_id == user_id)
+            ),
         )
         
         return results
@@ -1,7 +1,10 @@
+import logging
+from functools import lru_cache
+
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
-from typing import Union, Dict, Any, List
+from typing import Union, Dict, Any, List, Tuple
 
 from app.logging_config import get_logger
 
@@ -92,6 +95,21 @@ class ForbiddenError(AppError):
             details=details
         )
 
+class ConflictError(AppError):
+    """Conflict with existing data error"""
+    def __init__(
+        self,
+        message: str = "The request conflicts with an existing resource",
+        error_code: str = "CONFLICT",
+        details: Union[Dict[str, Any], List[Dict[str, Any]], None] = None
+    ):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code=error_code,
+            message=message,
+            details=details
+        )
+
 class InternalServerError(AppError):
     """Internal server error"""
     def __init__(
@@ -107,6 +125,11 @@ class InternalServerError(AppError):
             details=details
         )
 
+@lru_cache(maxsize=1024)
+def _loc_key(loc: Tuple[Any, ...]) -> str:
+    """Dotted field path for a validation error location"""
+    return ".".join(map(str, loc))
+
 def setup_error_handlers(app: FastAPI) -> None:
     """Setup FastAPI error handlers"""
     
@@ -124,19 +147,20 @@ def setup_error_handlers(app: FastAPI) -> None:
         if exc.details:
             error_response["error"]["details"] = exc.details
         
-        # Extract request ID from state if available
-        request_id = getattr(request.state, "request_id", None)
-        
-        logger.error(f"App error: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "status_code": exc.status_code,
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "details": exc.details
-        })
+        if logger.isEnabledFor(logging.ERROR):
+            # Extract request ID from state if available
+            request_id = getattr(request.state, "request_id", None)
+            
+            logger.error("App error: %s", exc.message, extra={
+                "error_code": exc.error_code,
+                "status_code": exc.status_code,
+                "request_id": request_id,
+                "url": str(request.url),
+                "method": request.method,
+                "details": exc.details
+            })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=error_response
         )
@@ -144,25 +168,27 @@ def setup_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(ValidationError)
     async def validation_error_handler(request: Request, exc: ValidationError):
         """Handle pydantic validation errors"""
-        details = []
-        for error in exc.errors():
-            details.append({
-                "field": ".".join(str(x) for x in error["loc"]),
+        details = [
+            {
+                "field": _loc_key(tuple(error["loc"])),
                 "message": error["msg"],
                 "type": error["type"]
-            })
-        
-        # Extract request ID from state if available
-        request_id = getattr(request.state, "request_id", None)
+            }
+            for error in exc.errors()
+        ]
         
-        logger.warning(f"Validation error", extra={
-            "request_id": request_id,
-            "url": str(request.url),
-            "method": request.method,
-            "validation_errors": details
-        })
+        if logger.isEnabledFor(logging.WARNING):
+            # Extract request ID from state if available
+            request_id = getattr(request.state, "request_id", None)
+            
+            logger.warning("Validation error", extra={
+                "request_id": request_id,
+                "url": str(request.url),
+                "method": request.method,
+                "validation_errors": details
+            })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "status": "error",
@@ -180,13 +206,13 @@ def setup_error_handlers(app: FastAPI) -> None:
         # Extract request ID from state if available
         request_id = getattr(request.state, "request_id", None)
         
-        logger.exception(f"Unhandled exception: {str(exc)}", extra={
+        logger.exception("Unhandled exception: %s", exc, extra={
             "request_id": request_id,
             "url": str(request.url),
             "method": request.method
         })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "status": "error",
@@ -1,10 +1,9 @@
-import json
 import logging
-from datetime import datetime
+import time
 
-from fastapi import HTTPException, Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -16,38 +15,48 @@ class APIException(Exception):
 
 async def api_exception_handler(request, exc):
     """Handle API exceptions and return appropriate response"""
-    return Response(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=json.dumps({"status": "error", "message": exc.detail}),
-        media_type="application/json"
+        content={"status": "error", "message": exc.detail},
     )
 
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(f"HTTP error: {exc.detail}")
-    return JSONResponse(
+    logger.error("HTTP error: %s", exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
     )
 
-async def unhandled_exception_handler(request: Request, exc: Exception):
-    logger.exception("Unhandled error")
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal Server Error"},
-    )
+class LoggingMiddleware:
+    """Pure ASGI middleware logging method, path, status and duration of each request"""
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = datetime.utcnow()
         try:
-            response = await call_next(request)
-            process_time = datetime.utcnow() - start_time
-            logger.info(
-                f"Request: {request.method} {request.url.path} - "
-                f"Status: {response.status_code} - "
-                f"Duration: {process_time.total_seconds():.3f}s"
-            )
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.error(f"Request failed: {request.method} {request.url.path} - Error: {str(e)}")
+            logger.error("Request failed: %s %s - Error: %s", scope["method"], scope["path"], e)
             raise
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request: %s %s - Status: %d - Duration: %.3fs",
+                scope["method"],
+                scope["path"],
+                status_code,
+                time.perf_counter() - start_time,
+            )
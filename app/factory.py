@@ -0,0 +1,232 @@
+"""
+Application Factory
+
+This module builds the EchoMind FastAPI application: routers, error handlers,
+middleware, OpenAPI documentation and startup/shutdown hooks.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel
+
+from app.error_handlers import setup_error_handlers
+from app.exception_handler import APIException, LoggingMiddleware, api_exception_handler
+from app.logging_config import get_logger, setup_logging
+from app.middleware import RequestIDMiddleware, setup_cors
+from app.security.rate_limiter import RateLimitHeadersMiddleware
+
+# Structured logging is configured on startup, so importing the app
+# (tests, migrations, tooling) has no filesystem side effects
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+LOG_DIR = "/mnt/data/logs"
+logger = get_logger(__name__)
+
+# (router, prefix, tag) as listed in app.routers.ALL_ROUTERS
+RouterSpec = Tuple[APIRouter, str, str]
+
+# ----------------------------- Response Models -----------------------------
+
+class APIResponse(BaseModel):
+    """Standard API response model used across endpoints"""
+    status: str
+    message: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+# The root status response never changes, so it is serialized once
+_ROOT_BODY = orjson.dumps({"status": "ok", "message": "EchoMind API is live"})
+
+# ----------------------------- Custom OpenAPI Documentation -----------------------------
+
+_API_DESCRIPTION = """
+        # EchoMind API
+        
+        This API provides endpoints for managing user memory, sessions, summaries, and code execution.
+        
+        ## Authentication
+        
+        All API endpoints require an API key for authentication. Add your API key to the request 
+        headers using the `X-API-Key` header.
+        
+        ## Response Format
+        
+        Most endpoints return responses in the following format:
+        
+        ```json
+        {
+            "status": "ok",
+            "message": "Operation completed successfully",
+            "data": { ... }
+        }
+        ```
+        
+        ## Error Handling
+        
+        Error responses have the following format:
+        
+        ```json
+        {
+            "status": "error",
+            "message": "Description of the error"
+        }
+        ```
+        
+        ## Rate Limiting
+        
+        API endpoints are rate-limited to prevent abuse. If you exceed the rate limit,
+        you will receive a 429 Too Many Requests response.
+        """
+
+# Descriptions shown for each tag in the API docs
+_TAG_DESCRIPTIONS: Dict[str, str] = {
+    "Code Execution": "Endpoints for executing and managing code",
+    "Health": "Health check endpoints",
+    "Sessions": "Endpoints for managing user sessions",
+    "Summaries": "Endpoints for accessing and managing user summaries",
+    "Milestones": "Endpoints for tracking user milestones",
+    "Memory": "Endpoints for managing user memory",
+    "Memory Visualization": "Endpoints for visualizing user memory in different formats",
+    "Personality": "Endpoints for managing agent personality profiles and user preferences",
+    "Authentication": "Endpoints for user authentication and API key management",
+    "Privacy": "Endpoints for privacy-related functionality including data export and PII management",
+    "Logging": "Endpoints for logging user interactions",
+    "Admin": "Admin-only endpoints for system management",
+    "Capsule": "Endpoints for managing memory capsules",
+    "Pickaxe": "Endpoints for Pickaxe knowledge base and agent operations",
+    "WebSocket": "WebSocket endpoints for real-time communication",
+    "Frontend": "Endpoints specifically designed for frontend applications",
+    "Knowledge": "Endpoints for knowledge base management and search",
+    "Agent": "Endpoints for agent management and interaction",
+    "Claude Code": "Endpoints for Claude Code AI code assistant",
+    "Relationships": "Endpoints for managing relationships between users",
+}
+
+# ----------------------------- Application -----------------------------
+
+def create_app(routers: Iterable[RouterSpec]) -> FastAPI:
+    """
+    Create the EchoMind API application
+    
+    Args:
+        routers: (router, prefix, tag) for each router to mount
+    
+    Returns:
+        The configured FastAPI application
+    """
+    app = FastAPI(
+        title="EchoMind API",
+        description="API for managing user memory, sessions, summaries, and code execution",
+        version="2.0.0",
+        docs_url=None,  # Disable the default docs URL
+        redoc_url=None,  # Disable the default redoc URL
+        default_response_class=ORJSONResponse,
+    )
+    
+    # Add routes
+    for router, prefix, tag in routers:
+        app.include_router(router, prefix=prefix, tags=[tag])
+    
+    # Add error handlers
+    app.add_exception_handler(APIException, api_exception_handler)
+    setup_error_handlers(app)
+    
+    # Add middleware
+    app.add_middleware(LoggingMiddleware)
+    
+    # Add rate limiting middleware
+    app.add_middleware(RateLimitHeadersMiddleware)
+    
+    # Add CORS middleware
+    setup_cors(app)
+    
+    # Add request ID middleware
+    app.add_middleware(RequestIDMiddleware)
+    
+    # Serve static files
+    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+    
+    def custom_openapi():
+        if app.openapi_schema:
+            return app.openapi_schema
+        
+        openapi_schema = get_openapi(
+            title="EchoMind API",
+            version="2.0.0",
+            description=_API_DESCRIPTION,
+            routes=app.routes,
+        )
+        
+        # Add custom documentation for each tag
+        for tag in openapi_schema["tags"]:
+            description = _TAG_DESCRIPTIONS.get(tag["name"])
+            if description:
+                tag["description"] = description
+        
+        app.openapi_schema = openapi_schema
+        return app.openapi_schema
+    
+    app.openapi = custom_openapi
+    
+    @app.get("/docs", include_in_schema=False)
+    async def custom_swagger_ui_html():
+        """Custom Swagger UI documentation endpoint"""
+        return get_swagger_ui_html(
+            openapi_url="/openapi.json",
+            title="EchoMind API Documentation",
+            swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4/swagger-ui-bundle.js",
+            swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@4/swagger-ui.css",
+        )
+    
+    @app.get("/", responses={200: {"model": APIResponse}},
+             summary="API Status",
+             description="Health check endpoint to verify that the API is running")
+    async def root():
+        """Health check endpoint"""
+        return Response(content=_ROOT_BODY, media_type="application/json")
+    
+    @app.on_event("startup")
+    async def startup_event():
+        """Configure logging, initialize database and seed initial data"""
+        # Creating the log directory touches the filesystem; keep it off the event loop
+        await asyncio.to_thread(setup_logging, log_level=LOG_LEVEL, log_dir=LOG_DIR)
+        
+        from app.database import AsyncSessionLocal, warm_pool
+        
+        # Seed initial data
+        try:
+            async with AsyncSessionLocal() as db:
+                # Seed personality profiles
+                from app.utils.personality_seed import seed_personality_profiles
+                await seed_personality_profiles(db)
+        except Exception as e:
+            logger.error(f"Error during startup: {str(e)}")
+        
+        # Pre-open pooled connections; failures only cost the first requests
+        # a connection handshake
+        errors = await warm_pool()
+        if errors:
+            logger.warning(
+                f"Could not pre-open {len(errors)} pooled database connections: {str(errors[0])}",
+                extra={"failed_connections": len(errors)}
+            )
+            
+        logger.info("EchoMind API initialized successfully", extra={
+            "version": "2.0.0",
+            "environment": "development"
+        })
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Write out log rows still queued for batched insertion"""
+        from app.batch_writer import stop_batchers
+        
+        await stop_batchers()
+    
+    return app
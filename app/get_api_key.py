@@ -17,7 +17,10 @@ VALID_API_KEYS = {
     "PULSE_API_KEY": "echomind-pulse-key"
 }
 
+# Hashed lookup set for the per-request key check
+_VALID_KEYS = frozenset(VALID_API_KEYS.values())
+
 async def get_api_key(api_key: str = Security(api_key_header)):
-    if api_key not in VALID_API_KEYS.values():
+    if not api_key or api_key not in _VALID_KEYS:
         raise HTTPException(status_code=403, detail="Invalid API key")
     return api_key
@@ -9,20 +9,25 @@ This module provides a client for the OpenAI API, including:
 """
 
 import asyncio
-import json
+import contextlib
+import logging
 import os
 import time
-from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Any, Union, AsyncIterator, TypedDict
 
 import httpx
+import orjson
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.logging_config import get_logger
+from app.logging_config import get_logger, request_id_ctx
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once; worker processes inherit the loaded
+# environment and skip re-reading the .env file
+if os.getenv("_ENV_LOADED") != "1":
+    load_dotenv()
+    os.environ["_ENV_LOADED"] = "1"
 
 logger = get_logger(__name__)
 
@@ -40,39 +45,38 @@ DEFAULT_TEMPERATURE = float(os.getenv("OPENAI_DEFAULT_TEMPERATURE", "0.7"))
 MAX_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "60"))
 TOKEN_LIMIT_WARNING_THRESHOLD = 0.8  # Log warning when token usage exceeds 80% of limit
 
-class OpenAIMessage(BaseModel):
+# HTTP connection pool
+MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "1000"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "200"))
+KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "75"))
+REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "60"))
+
+# Embedding request coalescing
+DEFAULT_EMBEDDING_MODEL = "text-embedding-ada-002"
+EMBEDDING_BATCH_SIZE = int(os.getenv("OPENAI_EMBEDDING_BATCH_SIZE", "256"))  # API accepts up to 2048 inputs
+EMBEDDING_BATCH_WINDOW = float(os.getenv("OPENAI_EMBEDDING_BATCH_WINDOW_MS", "10")) / 1000
+
+class OpenAIMessage(TypedDict, total=False):
     """
     Message format for OpenAI Chat API
-    """
-    role: str = Field(..., description="Role of the message sender (system, user, assistant)")
-    content: str = Field(..., description="Content of the message")
-    name: Optional[str] = Field(None, description="Name of the sender (optional)")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "role": "user",
-                "content": "Hello, how are you?",
-                "name": "John"
-            }
-        }
+    role and content are required; name is optional.
+    """
+    role: str  # Role of the message sender (system, user, assistant)
+    content: str  # Content of the message
+    name: str  # Name of the sender
 
-class TokenUsage(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TokenUsage:
     """
     Token usage statistics
-    """
-    prompt_tokens: int = Field(..., description="Tokens used in the prompt")
-    completion_tokens: int = Field(..., description="Tokens used in the completion")
-    total_tokens: int = Field(..., description="Total tokens used")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "prompt_tokens": 100,
-                "completion_tokens": 50,
-                "total_tokens": 150
-            }
-        }
+    Built from the API's own usage block on every response, so it is a
+    plain dataclass rather than a validated model.
+    """
+    prompt_tokens: int  # Tokens used in the prompt
+    completion_tokens: int  # Tokens used in the completion
+    total_tokens: int  # Total tokens used
 
 class APIResponse(BaseModel):
     """
@@ -81,11 +85,12 @@ class APIResponse(BaseModel):
     success: bool = Field(..., description="Whether the request was successful")
     data: Optional[Any] = Field(None, description="Response data if successful")
     error: Optional[str] = Field(None, description="Error message if request failed")
+    status_code: Optional[int] = Field(None, description="HTTP status if the API rejected the request")
     usage: Optional[TokenUsage] = Field(None, description="Token usage statistics")
     model: Optional[str] = Field(None, description="Model used for the request")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "data": {
@@ -112,6 +117,19 @@ class APIResponse(BaseModel):
                 "model": "gpt-4-0613"
             }
         }
+    )
+
+def _fail_embedding_calls(items: List[tuple], error: Optional[Exception] = None):
+    """
+    Fail the futures of queued embedding calls that haven't been resolved
+
+    Args:
+        items: Queued (model, input_texts, future) entries
+        error: Exception to raise in the callers (default: client closed)
+    """
+    for _, _, future in items:
+        if not future.done():
+            future.set_exception(error or RuntimeError("OpenAI client was closed"))
 
 class OpenAIClient:
     """
@@ -148,11 +166,33 @@ class OpenAIClient:
         if not self.api_key:
             logger.warning("No OpenAI API key provided. API calls will fail.")
         
-        # Configure the HTTP client with timeouts and retries
+        # Precompute per-endpoint URLs and the encoded Authorization header
+        self._urls = {
+            endpoint: f"{self.api_base}/{endpoint}"
+            for endpoint in ("chat/completions", "embeddings", "moderations")
+        }
+        self._auth_header = f"Bearer {self.api_key}".encode()
+        
+        # Configure the HTTP client with a keep-alive pool sized for bursts.
+        # Connect and pool waits are unbounded so queued requests aren't failed
+        # with PoolTimeout; reads and writes keep the request timeout.
+        # HTTP/2 lets concurrent requests share one connection; HTTP/1.1
+        # stays enabled as a fallback for proxies that don't negotiate h2.
         self.client = httpx.AsyncClient(
-            timeout=60.0,  # 60 second timeout
+            http2=True,
+            timeout=httpx.Timeout(
+                connect=None,
+                pool=None,
+                read=REQUEST_TIMEOUT,
+                write=REQUEST_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
             headers={
-                "Authorization": f"Bearer {self.api_key}",
+                "Authorization": self._auth_header,
                 "Content-Type": "application/json"
             }
         )
@@ -160,8 +200,21 @@ class OpenAIClient:
         if self.org_id:
             self.client.headers["OpenAI-Organization"] = self.org_id
         
-        # Rate limiting
-        self.request_timestamps = []
+        # Rate limiting (token bucket refilled continuously up to one minute's quota)
+        self._capacity = float(MAX_REQUESTS_PER_MINUTE)
+        self._tokens = self._capacity
+        self._rate = MAX_REQUESTS_PER_MINUTE / 60.0
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+        # Whether the negotiated HTTP version has been logged yet
+        self._http_version_logged = False
+        
+        # Embedding batching (queue and worker are created on first use)
+        self._embed_queue: Optional[asyncio.Queue] = None
+        self._embed_worker: Optional[asyncio.Task] = None
+        # In-flight batch requests, referenced so they aren't garbage collected
+        self._embed_batches: Set[asyncio.Task] = set()
         
         logger.info(
             "OpenAI client initialized",
@@ -181,25 +234,34 @@ class OpenAIClient:
     
     async def close(self):
         """Close the HTTP client session"""
+        if self._embed_worker is not None:
+            self._embed_worker.cancel()
+            self._embed_worker = None
+        for task in self._embed_batches:
+            task.cancel()
+        # Fail embedding calls still waiting to be batched
+        while self._embed_queue is not None and not self._embed_queue.empty():
+            _fail_embedding_calls([self._embed_queue.get_nowait()])
         await self.client.aclose()
     
     async def _check_rate_limit(self):
         """
         Check if we're within the rate limit
         
-        Waits if necessary to stay within rate limits.
+        Waits if necessary to stay within rate limits, then takes a token.
         """
-        now = time.time()
-        
-        # Remove timestamps older than 1 minute
-        self.request_timestamps = [ts for ts in self.request_timestamps if now - ts < 60]
-        
-        # If we're at the rate limit, wait until we can make another request
-        if len(self.request_timestamps) >= MAX_REQUESTS_PER_MINUTE:
-            oldest_timestamp = min(self.request_timestamps)
-            wait_time = 60 - (now - oldest_timestamp)
-            
-            if wait_time > 0:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                # Wait until a full token has been refilled
+                wait_time = (1 - self._tokens) / self._rate
                 logger.warning(
                     f"Rate limit reached. Waiting {wait_time:.2f} seconds",
                     extra={
@@ -208,176 +270,231 @@ class OpenAIClient:
                     }
                 )
                 await asyncio.sleep(wait_time)
-                # Recursive call after waiting to check again
-                await self._check_rate_limit()
     
     async def _make_request(
         self,
         endpoint: str,
         data: Dict[str, Any],
-        retry_count: int = 0,
         max_retries: int = 3
     ) -> APIResponse:
         """
         Make a request to the OpenAI API
         
+        Retries on rate limiting and network errors with backoff.
+        
         Args:
             endpoint: API endpoint path
             data: Request data
-            retry_count: Current retry count
             max_retries: Maximum number of retries
             
         Returns:
             APIResponse: Response from the API
         """
-        await self._check_rate_limit()
+        url = self._urls.get(endpoint) or f"{self.api_base}/{endpoint}"
+        model_used = data.get("model", self.default_model)
         
-        url = f"{self.api_base}/{endpoint}"
-        
-        try:
-            # Add timestamp for rate limiting
-            self.request_timestamps.append(time.time())
-            
-            # Make the request
-            start_time = time.time()
-            response = await self.client.post(url, json=data)
-            duration = time.time() - start_time
+        for retry_count in range(max_retries + 1):
+            await self._check_rate_limit()
             
-            # Log request
-            logger.info(
-                f"OpenAI API request to {endpoint}",
-                extra={
-                    "endpoint": endpoint,
-                    "duration": duration,
-                    "model": data.get("model", self.default_model),
-                    "status_code": response.status_code
-                }
-            )
-            
-            # Check for success
-            if response.status_code == 200:
-                # Parse response
-                response_data = response.json()
+            try:
+                # Make the request
+                start_ns = time.perf_counter_ns()
+                response = await self.client.post(url, content=orjson.dumps(data))
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 
-                # Extract usage
-                usage = None
-                if "usage" in response_data:
-                    usage = TokenUsage(
-                        prompt_tokens=response_data["usage"]["prompt_tokens"],
-                        completion_tokens=response_data["usage"]["completion_tokens"],
-                        total_tokens=response_data["usage"]["total_tokens"]
-                    )
-                    
-                    # Log usage
+                # Log request
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(
-                        "OpenAI API token usage",
+                        f"OpenAI API request to {endpoint}",
                         extra={
                             "endpoint": endpoint,
-                            "model": data.get("model", self.default_model),
-                            "prompt_tokens": usage.prompt_tokens,
-                            "completion_tokens": usage.completion_tokens,
-                            "total_tokens": usage.total_tokens
+                            "duration": duration,
+                            "model": model_used,
+                            "status_code": response.status_code
                         }
                     )
                 
-                # Return successful response
-                return APIResponse(
-                    success=True,
-                    data=response_data,
-                    usage=usage,
-                    model=data.get("model", self.default_model)
-                )
-                
-            else:
-                # Handle error responses
-                error_data = response.json()
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    # Server asked us to retry after a delay
-                    retry_after = response.headers.get("Retry-After")
+                # Check for success
+                if response.status_code == 200:
+                    if not self._http_version_logged:
+                        self._http_version_logged = True
+                        logger.debug("OpenAI API connection using %s", response.http_version)
+                    
+                    # Parse response
+                    response_data = orjson.loads(response.content)
                     
-                    if retry_after:
-                        retry_after = float(retry_after)
+                    # Extract usage
+                    usage = None
+                    if "usage" in response_data:
+                        usage = TokenUsage(
+                            prompt_tokens=response_data["usage"]["prompt_tokens"],
+                            completion_tokens=response_data["usage"]["completion_tokens"],
+                            total_tokens=response_data["usage"]["total_tokens"]
+                        )
+                        
+                        # Log usage
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(
+                                "OpenAI API token usage",
+                                extra={
+                                    "endpoint": endpoint,
+                                    "model": model_used,
+                                    "prompt_tokens": usage.prompt_tokens,
+                                    "completion_tokens": usage.completion_tokens,
+                                    "total_tokens": usage.total_tokens
+                                }
+                            )
+                    
+                    # Return successful response; the payload came from the API,
+                    # so skip re-validating it
+                    return APIResponse.model_construct(
+                        success=True,
+                        data=response_data,
+                        usage=usage,
+                        model=model_used
+                    )
+                    
+                else:
+                    # Handle error responses; proxies and gateways may answer
+                    # with HTML or plain text, so only decode JSON bodies
+                    error_data = None
+                    if response.headers.get("content-type", "").startswith("application/json"):
+                        with contextlib.suppress(orjson.JSONDecodeError):
+                            error_data = orjson.loads(response.content)
+                    
+                    if isinstance(error_data, dict) and isinstance(error_data.get("error"), dict):
+                        error_message = error_data["error"].get("message", "Unknown error")
                     else:
-                        # Default to exponential backoff
-                        retry_after = min(2 ** retry_count, 60)
+                        error_message = response.text[:500] or "Unknown error"
+                    
+                    # Handle rate limiting
+                    if response.status_code == 429:
+                        # Server asked us to retry after a delay
+                        retry_after = response.headers.get("Retry-After")
+                        
+                        if retry_after:
+                            retry_after = float(retry_after)
+                        else:
+                            # Default to exponential backoff
+                            retry_after = min(2 ** retry_count, 60)
+                        
+                        logger.warning(
+                            f"OpenAI API rate limit reached. Retrying after {retry_after} seconds",
+                            extra={
+                                "endpoint": endpoint,
+                                "retry_count": retry_count,
+                                "retry_after": retry_after
+                            }
+                        )
+                        
+                        if retry_count < max_retries:
+                            await asyncio.sleep(retry_after)
+                            continue
                     
-                    logger.warning(
-                        f"OpenAI API rate limit reached. Retrying after {retry_after} seconds",
+                    # Log error
+                    logger.error(
+                        f"OpenAI API error: {error_message}",
                         extra={
                             "endpoint": endpoint,
-                            "retry_count": retry_count,
-                            "retry_after": retry_after
+                            "status_code": response.status_code,
+                            "error": error_message
                         }
                     )
                     
-                    if retry_count < max_retries:
-                        await asyncio.sleep(retry_after)
-                        return await self._make_request(
-                            endpoint=endpoint,
-                            data=data,
-                            retry_count=retry_count + 1,
-                            max_retries=max_retries
-                        )
-                
-                # Log error
+                    # Return error response
+                    return APIResponse.model_construct(
+                        success=False,
+                        error=error_message,
+                        status_code=response.status_code,
+                        model=model_used
+                    )
+                    
+            except Exception as e:
+                # Only the final failure gets a full traceback; retryable
+                # attempts log the exception type and message
+                retrying = retry_count < max_retries
                 logger.error(
-                    f"OpenAI API error: {error_message}",
+                    f"Error calling OpenAI API: {type(e).__name__}: {e}",
                     extra={
                         "endpoint": endpoint,
-                        "status_code": response.status_code,
-                        "error": error_message
-                    }
+                        "error": str(e),
+                        "retry_count": retry_count
+                    },
+                    exc_info=not retrying
                 )
                 
+                # Retry on network errors
+                if retrying:
+                    retry_after = min(2 ** retry_count, 60)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            f"Retrying OpenAI API request after {retry_after} seconds",
+                            extra={
+                                "endpoint": endpoint,
+                                "retry_count": retry_count,
+                                "retry_after": retry_after
+                            }
+                        )
+                    await asyncio.sleep(retry_after)
+                    continue
+                
                 # Return error response
-                return APIResponse(
+                return APIResponse.model_construct(
                     success=False,
-                    error=error_message,
-                    model=data.get("model", self.default_model)
+                    error=f"Error calling OpenAI API: {str(e)}",
+                    model=model_used
                 )
-                
-        except Exception as e:
-            logger.error(
-                f"Error calling OpenAI API: {str(e)}",
-                extra={
-                    "endpoint": endpoint,
-                    "error": str(e)
-                },
-                exc_info=True
-            )
+    
+    async def _stream_request(
+        self,
+        endpoint: str,
+        data: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Make a streaming request to the OpenAI API
+        
+        Parses the server-sent event stream as it arrives and yields each
+        chunk as soon as its line is complete.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request data (with "stream": True)
+            
+        Yields:
+            Dict[str, Any]: Parsed stream chunks
             
-            # Retry on network errors
-            if retry_count < max_retries:
-                retry_after = min(2 ** retry_count, 60)
-                logger.info(
-                    f"Retrying OpenAI API request after {retry_after} seconds",
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        await self._check_rate_limit()
+        
+        url = self._urls.get(endpoint) or f"{self.api_base}/{endpoint}"
+        
+        async with self.client.stream("POST", url, content=orjson.dumps(data)) as response:
+            if response.status_code != 200:
+                await response.aread()
+                logger.error(
+                    f"OpenAI API streaming error for {endpoint}",
                     extra={
                         "endpoint": endpoint,
-                        "retry_count": retry_count,
-                        "retry_after": retry_after
+                        "status_code": response.status_code
                     }
                 )
-                await asyncio.sleep(retry_after)
-                return await self._make_request(
-                    endpoint=endpoint,
-                    data=data,
-                    retry_count=retry_count + 1,
-                    max_retries=max_retries
-                )
+                response.raise_for_status()
             
-            # Return error response
-            return APIResponse(
-                success=False,
-                error=f"Error calling OpenAI API: {str(e)}",
-                model=data.get("model", self.default_model)
-            )
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                
+                yield orjson.loads(payload)
     
     async def chat_completion(
         self,
-        messages: List[Union[OpenAIMessage, Dict[str, str]]],
+        messages: List[OpenAIMessage],
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
@@ -387,7 +504,7 @@ class OpenAIClient:
         stop: Optional[Union[str, List[str]]] = None,
         response_format: Optional[Dict[str, str]] = None,
         stream: bool = False
-    ) -> APIResponse:
+    ) -> Union[APIResponse, AsyncIterator[Dict[str, Any]]]:
         """
         Create a chat completion
         
@@ -404,34 +521,28 @@ class OpenAIClient:
             stream: Whether to stream the response
             
         Returns:
-            APIResponse: Response from the API
+            APIResponse: Response from the API, or an async iterator of
+            completion chunks when stream is True
         """
-        # Process messages to ensure they're in the right format
-        processed_messages = []
-        for message in messages:
-            if isinstance(message, OpenAIMessage):
-                processed_messages.append(message.dict(exclude_none=True))
-            elif isinstance(message, dict):
-                # Validate message has required fields
-                if "role" not in message or "content" not in message:
-                    logger.error(
-                        "Invalid message format: missing required fields",
-                        extra={"message": message}
-                    )
-                    return APIResponse(
-                        success=False,
-                        error="Invalid message format: missing required fields"
-                    )
-                processed_messages.append(message)
+        # Messages are plain dicts (OpenAIMessage is a TypedDict), so they are
+        # sent as-is once validated
+        processed_messages = messages
+        
+        # Validate messages, stopping at the first invalid one
+        invalid = next(
+            (
+                message for message in processed_messages
+                if not isinstance(message, dict) or "role" not in message or "content" not in message
+            ),
+            None
+        )
+        if invalid is not None:
+            if isinstance(invalid, dict):
+                error = "Invalid message format: missing required fields"
             else:
-                logger.error(
-                    "Invalid message format: must be OpenAIMessage or dict",
-                    extra={"message": message}
-                )
-                return APIResponse(
-                    success=False,
-                    error="Invalid message format: must be OpenAIMessage or dict"
-                )
+                error = "Invalid message format: must be a dict"
+            logger.error(error, extra={"message": invalid})
+            return APIResponse(success=False, error=error)
         
         # Build request data
         data = {
@@ -467,6 +578,9 @@ class OpenAIClient:
             data["response_format"] = response_format
         
         # Make the request
+        if stream:
+            return self._stream_request("chat/completions", data)
+        
         return await self._make_request("chat/completions", data)
     
     async def simple_completion(
@@ -524,6 +638,9 @@ class OpenAIClient:
         """
         Create embeddings for text
         
+        Calls arriving within a short window are coalesced into a single
+        embeddings request; each caller receives only its own embeddings.
+        
         Args:
             text: Text or list of texts to embed
             model: Model to use (default: text-embedding-ada-002)
@@ -537,14 +654,114 @@ class OpenAIClient:
         else:
             input_texts = text
         
-        # Build request data
-        data = {
-            "model": model or "text-embedding-ada-002",
-            "input": input_texts
-        }
+        if self._embed_worker is None or self._embed_worker.done():
+            self._embed_queue = asyncio.Queue()
+            self._embed_worker = asyncio.create_task(self._embedding_worker())
         
-        # Make the request
-        return await self._make_request("embeddings", data)
+        future = asyncio.get_running_loop().create_future()
+        await self._embed_queue.put((model or DEFAULT_EMBEDDING_MODEL, input_texts, future))
+        return await future
+    
+    async def _embedding_worker(self):
+        """
+        Collect queued embedding calls into batches and send them
+        
+        A batch closes when it reaches EMBEDDING_BATCH_SIZE inputs or
+        EMBEDDING_BATCH_WINDOW has passed since its first call. Batches are
+        sent in the background, so the next batch is collected while earlier
+        requests are still in flight.
+        """
+        loop = asyncio.get_running_loop()
+        # The worker outlives the request that started it; don't tag its logs
+        # with that request's ID
+        request_id_ctx.set(None)
+        
+        while True:
+            batch = [await self._embed_queue.get()]
+            size = len(batch[0][1])
+            deadline = loop.time() + EMBEDDING_BATCH_WINDOW
+            
+            try:
+                while size < EMBEDDING_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._embed_queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    batch.append(item)
+                    size += len(item[1])
+            except asyncio.CancelledError:
+                # Closed while collecting; the calls already taken off the
+                # queue would otherwise wait forever
+                _fail_embedding_calls(batch)
+                raise
+            
+            # Only inputs for the same model can share a request
+            groups: Dict[str, List[tuple]] = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            
+            for model, items in groups.items():
+                task = asyncio.create_task(self._send_embedding_batch(model, items))
+                self._embed_batches.add(task)
+                task.add_done_callback(self._embed_batches.discard)
+    
+    async def _send_embedding_batch(self, model: str, items: List[tuple]):
+        """
+        Send one coalesced embeddings request and resolve each caller's future
+        
+        Args:
+            model: Embedding model for the batch
+            items: Queued (model, input_texts, future) entries
+        """
+        try:
+            response = await self._make_request("embeddings", {
+                "model": model,
+                "input": [text for _, input_texts, _ in items for text in input_texts]
+            })
+            
+            if not response.success:
+                status_code = response.status_code
+                if len(items) > 1 and status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                    # The API rejected the request, possibly because of one
+                    # caller's input; send each caller's inputs on their own
+                    # so the others still get their embeddings (not on rate
+                    # limiting, where more requests would only make it worse)
+                    await asyncio.gather(*(
+                        self._send_embedding_batch(model, [item]) for item in items
+                    ))
+                    return
+                
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_result(response)
+                return
+            
+            embeddings = sorted(response.data["data"], key=lambda e: e["index"])
+            offset = 0
+            for _, input_texts, future in items:
+                count = len(input_texts)
+                own = [
+                    {**embedding, "index": i}
+                    for i, embedding in enumerate(embeddings[offset:offset + count])
+                ]
+                offset += count
+                
+                if not future.done():
+                    # Token usage is reported for the whole batch, so it isn't
+                    # attributed to individual callers
+                    future.set_result(APIResponse.model_construct(
+                        success=True,
+                        data={**response.data, "data": own},
+                        model=response.model
+                    ))
+        except asyncio.CancelledError:
+            _fail_embedding_calls(items)
+            raise
+        except Exception as e:
+            _fail_embedding_calls(items, e)
     
     async def moderation(
         self,
@@ -578,22 +795,54 @@ class OpenAIClient:
         # Make the request
         return await self._make_request("moderations", data)
 
-# Create a default client instance
-default_client = OpenAIClient()
+# Shared client instances, keyed by (api_key, org_id, api_base)
+_CLIENT_CACHE: Dict[tuple, OpenAIClient] = {}
+
+def get_client(
+    api_key: Optional[str] = None,
+    org_id: Optional[str] = None,
+    api_base: Optional[str] = None
+) -> OpenAIClient:
+    """
+    Get a shared OpenAI client for the given credentials
+    
+    Clients are created on first use and reused afterwards so that callers
+    with the same credentials share one connection pool.
+    
+    Args:
+        api_key: OpenAI API key (default: from environment)
+        org_id: OpenAI organization ID (default: from environment)
+        api_base: OpenAI API base URL (default: from environment)
+        
+    Returns:
+        OpenAIClient: Shared client instance
+    """
+    key = (api_key or OPENAI_API_KEY, org_id or OPENAI_ORG_ID, api_base or OPENAI_API_BASE)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = OpenAIClient(api_key=key[0], org_id=key[1], api_base=key[2])
+        _CLIENT_CACHE[key] = client
+    return client
+
+def __getattr__(name: str) -> Any:
+    """Create the default client lazily on first access"""
+    if name == "default_client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions that use the default client
 async def chat_completion(*args, **kwargs) -> APIResponse:
     """Convenience function for chat completions using the default client"""
-    return await default_client.chat_completion(*args, **kwargs)
+    return await get_client().chat_completion(*args, **kwargs)
 
 async def simple_completion(*args, **kwargs) -> str:
     """Convenience function for simple completions using the default client"""
-    return await default_client.simple_completion(*args, **kwargs)
+    return await get_client().simple_completion(*args, **kwargs)
 
 async def create_embedding(*args, **kwargs) -> APIResponse:
     """Convenience function for embeddings using the default client"""
-    return await default_client.create_embedding(*args, **kwargs)
+    return await get_client().create_embedding(*args, **kwargs)
 
 async def moderation(*args, **kwargs) -> APIResponse:
     """Convenience function for moderation using the default client"""
-    return await default_client.moderation(*args, **kwargs)
\ No newline at end of file
+    return await get_client().moderation(*args, **kwargs)
\ No newline at end of file
@@ -1,11 +1,18 @@
-import json
+import atexit
+import contextlib
 import logging
+import os
+import queue
 import sys
+import time
 import traceback
-from datetime import datetime
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 import logging.config
 
 # Log levels
@@ -16,13 +23,30 @@ INFO = logging.INFO
 DEBUG = logging.DEBUG
 NOTSET = logging.NOTSET
 
+# Maximum number of records buffered for the file logging thread
+LOG_QUEUE_SIZE = 10000
+
+# Write buffer for each log file; flushed whenever the log queue runs empty
+LOG_FILE_BUFFER_SIZE = 1 << 20
+
+# ID of the HTTP request being handled, set by RequestIDMiddleware
+request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes present on every LogRecord; anything else was passed via `extra`
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+# Naive datetimes in log fields are UTC (the app uses datetime.utcnow())
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter to output logs in JSON format
+    
+    Timestamps come from the record's creation time, in UTC.
     """
     def format(self, record):
         log_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -40,14 +64,150 @@ class JSONFormatter(logging.Formatter):
             }
             
         # Add extra fields
-        if hasattr(record, "extra"):
-            log_record.update(record.extra)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_record[key] = value
             
-        return json.dumps(log_record)
+        return orjson.dumps(log_record, default=str, option=_JSON_OPTIONS).decode()
+
+class LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for an in-process listener
+    
+    Records are enqueued as-is so message and JSON formatting happen on the
+    listener thread instead of the caller's (event loop) thread. If the queue
+    is full (the disk can't keep up) records are dropped rather than blocking.
+    """
+    def prepare(self, record):
+        return record
+    
+    def enqueue(self, record):
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait(record)
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that doesn't flush after every record
+    
+    Records accumulate in a large write buffer and reach the disk when
+    FlushingQueueListener finds the queue empty, so bursts are written in a
+    few large writes. Rotation and close() still flush.
+    """
+    def _open(self):
+        # The handler owns the stream and closes it in close()/rollover
+        stream = open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE, encoding=self.encoding, errors=self.errors)  # noqa: SIM115
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        # The base class seeks to the end of the file to find its size, which
+        # flushes the write buffer; keep a running size instead
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        size = len(self.format(record)) + 1
+        if self._size + size >= self.maxBytes:
+            return True
+        self._size += size
+        return False
+    
+    def flush(self):
+        # Called by emit() for every record; flushing is left to the listener
+        pass
+    
+    def flush_buffer(self):
+        """Write buffered records to the file"""
+        super().flush()
+
+class FlushingQueueListener(QueueListener):
+    """Queue listener that flushes buffered file handlers when it runs out of records"""
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                if isinstance(handler, BufferedRotatingFileHandler):
+                    handler.flush_buffer()
+            return self.queue.get(block)
+
+class RateLimitingFilter(logging.Filter):
+    """
+    Drop repeats of the same warning or error within a short interval
+    
+    During cascading failures every request can log the same message; this
+    keeps log I/O from becoming the bottleneck. Records below WARNING are
+    never dropped.
+    """
+    def __init__(self, interval: float = 1.0, max_entries: int = 1000):
+        super().__init__()
+        self.interval = interval
+        self.max_entries = max_entries
+        self._last_seen: Dict[tuple, float] = {}
+        # The same filter instance is shared by several handlers, which see
+        # each record in turn; remember the decision for the current record
+        self._last_record = None
+        self._last_decision = True
+    
+    def filter(self, record):
+        if record.levelno < WARNING:
+            return True
+        if record is self._last_record:
+            return self._last_decision
+        
+        key = (record.name, record.levelno, str(record.msg), record.args)
+        now = record.created
+        try:
+            last = self._last_seen.get(key)
+        except TypeError:
+            # Unhashable arguments (e.g. a mapping); don't rate limit
+            return True
+        decision = last is None or now - last >= self.interval
+        if decision:
+            if len(self._last_seen) >= self.max_entries:
+                self._last_seen.clear()
+            self._last_seen[key] = now
+        
+        self._last_record = record
+        self._last_decision = decision
+        return decision
+
+class RequestIDFilter(logging.Filter):
+    """
+    Tag records logged while handling a request with its request_id
+    
+    Runs on the logging thread of the caller, where the request's context
+    is active, so call sites don't need to pass the ID in `extra`.
+    """
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            request_id = request_id_ctx.get()
+            if request_id is not None:
+                record.request_id = request_id
+        return True
+
+# Listener that owns the file handlers (set up by setup_logging)
+_queue_listener: Optional[FlushingQueueListener] = None
+
+# (log_level, log_dir) of the active configuration
+_configured_with: Optional[tuple] = None
+
+def _stop_queue_listener():
+    """Flush queued records and stop the file logging listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
 
-def get_logger(name: str, level: int = INFO) -> logging.Logger:
+def get_logger(name: str, level: int = NOTSET) -> logging.Logger:
     """
     Get a logger instance with the specified name and level
+    
+    By default the level is inherited from the parent logger, so loggers
+    created after setup_logging (e.g. in lazily imported modules) follow
+    LOG_LEVEL.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -61,6 +221,12 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: The directory to store log files
     """
+    # Repeat calls (e.g. the app module being imported again) would tear
+    # down and rebuild identical handlers
+    global _queue_listener, _configured_with
+    if _queue_listener is not None and _configured_with == (log_level, log_dir):
+        return
+    
     # Create log directory if it doesn't exist
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
@@ -77,6 +243,38 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     # Get the numeric log level
     numeric_level = level_map.get(log_level.upper(), INFO)
     
+    # File handlers are driven by a background listener so that disk I/O and
+    # rotation don't block the event loop
+    _stop_queue_listener()
+    
+    json_formatter = JSONFormatter()
+    
+    file_handler = BufferedRotatingFileHandler(
+        log_path / "app.log",
+        maxBytes=10485760,  # 10 MB
+        backupCount=10
+    )
+    file_handler.setLevel(INFO)
+    file_handler.setFormatter(json_formatter)
+    
+    error_file_handler = BufferedRotatingFileHandler(
+        log_path / "error.log",
+        maxBytes=10485760,  # 10 MB
+        backupCount=10
+    )
+    error_file_handler.setLevel(ERROR)
+    error_file_handler.setFormatter(json_formatter)
+    
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _queue_listener = FlushingQueueListener(
+        log_queue,
+        file_handler,
+        error_file_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    _configured_with = (log_level, log_dir)
+    
     # Configure logging
     logging_config = {
         "version": 1,
@@ -89,47 +287,46 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
                 "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             }
         },
+        "filters": {
+            "rate_limit": {
+                "()": RateLimitingFilter
+            },
+            "request_id": {
+                "()": RequestIDFilter
+            }
+        },
         "handlers": {
             "console": {
                 "level": "DEBUG",
                 "class": "logging.StreamHandler",
                 "formatter": "standard",
+                "filters": ["rate_limit"],
                 "stream": sys.stdout
             },
-            "file": {
+            "queue": {
                 "level": "INFO",
-                "class": "logging.handlers.RotatingFileHandler",
-                "formatter": "json",
-                "filename": log_path / "app.log",
-                "maxBytes": 10485760,  # 10 MB
-                "backupCount": 10
-            },
-            "error_file": {
-                "level": "ERROR",
-                "class": "logging.handlers.RotatingFileHandler",
-                "formatter": "json",
-                "filename": log_path / "error.log",
-                "maxBytes": 10485760,  # 10 MB
-                "backupCount": 10
+                "()": LocalQueueHandler,
+                "filters": ["rate_limit", "request_id"],
+                "queue": log_queue
             }
         },
         "loggers": {
             "": {  # Root logger
-                "handlers": ["console", "file", "error_file"],
+                "handlers": ["console", "queue"],
                 "level": numeric_level
             },
             "app": {
-                "handlers": ["console", "file", "error_file"],
+                "handlers": ["console", "queue"],
                 "level": numeric_level,
                 "propagate": False
             },
             "uvicorn": {
-                "handlers": ["console", "file"],
+                "handlers": ["console", "queue"],
                 "level": numeric_level,
                 "propagate": False
             },
             "sqlalchemy": {
-                "handlers": ["console", "file"],
+                "handlers": ["console", "queue"],
                 "level": "WARNING",
                 "propagate": False
             }
@@ -4,4 +4,7 @@ EchoMind API Middleware Package
 This package contains middleware components for the EchoMind API.
 """
 
-from app.middleware.cors import setup_cors
\ No newline at end of file
+from app.middleware.cors import setup_cors
+from app.middleware.request_id import RequestIDMiddleware
+
+__all__ = ["RequestIDMiddleware", "setup_cors"]
@@ -6,7 +6,8 @@ to allow frontend applications to make requests to the API.
 """
 
 import os
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.applications import Starlette
@@ -16,6 +17,43 @@ from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Default allowed origins
+DEFAULT_ORIGINS = (
+    "http://localhost",
+    "http://localhost:3000",
+    "http://localhost:8000",
+    "https://app.echomind.io",
+    "https://dev.echomind.io",
+    "https://staging.echomind.io"
+)
+
+# Methods used by the API routes
+ALLOWED_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
+# Response headers readable by browser clients (set by the rate limiter and
+# RequestIDMiddleware)
+EXPOSED_HEADERS = (
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "X-Request-ID"
+)
+
+# Seconds browsers may cache a preflight result (Chrome caps this at 2 hours)
+PREFLIGHT_MAX_AGE = 7200
+
+@lru_cache(maxsize=1)
+def get_env_origins() -> Tuple[str, ...]:
+    """
+    Allowed origins from the CORS_ORIGINS environment variable (comma
+    separated), or the defaults. Parsed on first use rather than at import,
+    so values loaded from .env files are seen.
+    """
+    origins = tuple(
+        origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
+    )
+    return origins or DEFAULT_ORIGINS
+
 def setup_cors(app: ASGIApp, origins: Optional[List[str]] = None) -> None:
     """
     Set up CORS middleware for the FastAPI application
@@ -29,36 +67,22 @@ def setup_cors(app: ASGIApp, origins: Optional[List[str]] = None) -> None:
     """
     # Get allowed origins from environment or use defaults
     if origins is None:
-        origins_env = os.getenv("CORS_ORIGINS", "")
-        if origins_env:
-            origins = [origin.strip() for origin in origins_env.split(",")]
-        else:
-            # Default allowed origins
-            origins = [
-                "http://localhost",
-                "http://localhost:3000",
-                "http://localhost:8000",
-                "https://app.echomind.io",
-                "https://dev.echomind.io",
-                "https://staging.echomind.io"
-            ]
+        origins = get_env_origins()
     
     # Log configured origins
     logger.info(
         "Setting up CORS middleware", 
-        extra={"origins": origins}
+        extra={"origins": list(origins)}
     )
     
-    # Add CORS middleware
+    # Add CORS middleware; CORSMiddleware checks each request's Origin with
+    # `in`, so a set makes that a hash lookup instead of a list scan
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=frozenset(origins),
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=ALLOWED_METHODS,
         allow_headers=["*"],
-        expose_headers=[
-            "X-Rate-Limit-Limit",
-            "X-Rate-Limit-Remaining", 
-            "X-Rate-Limit-Reset"
-        ]
+        expose_headers=EXPOSED_HEADERS,
+        max_age=PREFLIGHT_MAX_AGE
     )
\ No newline at end of file
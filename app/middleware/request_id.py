@@ -0,0 +1,80 @@
+"""
+Request ID Middleware for EchoMind API
+
+This module assigns every HTTP request a unique ID, returns it in the
+X-Request-ID response header and logs the start and completion of the request.
+"""
+
+import logging
+import time
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logging_config import get_logger, request_id_ctx
+
+# Request-scoped logger used for request start/completion records
+request_logger = get_logger("app.request")
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware that tags each request with an ID
+
+    The ID is stored in scope["state"], so handlers can read it as
+    request.state.request_id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        # Log records emitted while handling the request pick the ID up from here
+        token = request_id_ctx.set(request_id)
+        # Get user ID from request if available
+        # This is a placeholder - in a real app, you would extract the user ID
+        # from the authenticated session
+        has_api_key = any(key == b"x-api-key" for key, _ in scope["headers"])
+        user_id = "anonymous" if has_api_key else None
+
+        if request_logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            request_logger.info("Request started", extra={
+                "user_id": user_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "client_host": client[0] if client else None
+            })
+
+        status_code = None
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("x-request-id", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            request_logger.error("Request failed", extra={
+                "error": str(e),
+                "processing_time": time.perf_counter() - start
+            })
+            raise
+        else:
+            if request_logger.isEnabledFor(logging.INFO):
+                request_logger.info("Request completed", extra={
+                    "status_code": status_code,
+                    "processing_time": time.perf_counter() - start
+                })
+        finally:
+            request_id_ctx.reset(token)
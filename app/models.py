@@ -1,10 +1,13 @@
 import enum
+import os
+import time
 import uuid
 from datetime import datetime, date
 from typing import Optional, List
 
 from sqlalchemy import (
     Column,
+    Computed,
     String,
     Text,
     Boolean,
@@ -12,21 +15,43 @@ from sqlalchemy import (
     Date,
     Enum,
     Float,
+    FetchedValue,
     ForeignKey,
     Index,
     Integer,
     UniqueConstraint,
-    JSON
+    JSON,
+    text
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, CITEXT, JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit millisecond timestamp followed by random bits"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
 def gen_id() -> str:
-    return str(uuid.uuid4())
+    # Time-ordered ids keep primary key inserts at the right edge of the index.
+    # Id columns are native UUIDs (as_uuid=False), so ids stay strings in Python
+    return str(uuid7())
+
+def gen_ids(n: int) -> List[str]:
+    """gen_id() for n rows at once: one clock read and one os.urandom call for the batch"""
+    timestamp = (time.time_ns() // 1_000_000) << 80 | 0x7 << 76 | 0x2 << 62
+    random_bits = os.urandom(10 * n)
+    # Clear the version and variant bits of each 80-bit random value
+    mask = ~(0xF << 76 | 0x3 << 62) & ((1 << 80) - 1)
+    return [
+        str(uuid.UUID(int=timestamp | int.from_bytes(random_bits[i:i + 10], "big") & mask))
+        for i in range(0, 10 * n, 10)
+    ]
 
 # ---------------------- ENUMS ----------------------
 class UserRole(str, enum.Enum):
@@ -84,19 +109,36 @@ class AgentType(str, enum.Enum):
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps"""
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Kept current on UPDATE by the touch_updated_at() trigger (see the
+    # b2e7c4d9a165 migration)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Read server-generated timestamps back with INSERT/UPDATE ... RETURNING,
+    # rather than expiring them (a later access would need another query,
+    # which AsyncSession can't issue implicitly)
+    __mapper_args__ = {"eager_defaults": True}
 
 class UserRelatedMixin:
-    """Mixin for entities related to a user"""
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    agent = Column(String, nullable=False, default="EchoMind", index=True)
+    """
+    Mixin for entities related to a user
+
+    No single-column indexes here: every table using the mixin has composite
+    indexes leading with user_id, which also serve user_id lookups and the
+    user delete cascade, and agent is only ever filtered on with user_id.
+    """
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    agent = Column(String, nullable=False, default="EchoMind")
 
 # ---------------------- USERS ----------------------
 class User(Base, TimestampMixin):
     __tablename__ = "users"
+    # Updated in place; stored with fillfactor=70 so updates can stay on the
+    # same page (set by migration a1c5e8f2b697)
     
-    id = Column(String, primary_key=True, default=gen_id)
-    email = Column(String, unique=True, index=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    # Case-insensitive in the database, so lookups and the unique index
+    # match regardless of case
+    email = Column(CITEXT, unique=True, index=True)
     name = Column(String, nullable=False)
     role = Column(Enum(UserRole), default=UserRole.individual, nullable=False)
     therapist_agent = Column(String)
@@ -108,7 +150,7 @@ class User(Base, TimestampMixin):
     # Relationships
     sessions = relationship("SessionLog", back_populates="user", cascade="all, delete-orphan")
     memory_snapshots = relationship("MemorySnapshot", back_populates="user", cascade="all, delete-orphan")
-    settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="joined")
+    settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan")
     milestones = relationship("MilestoneLog", back_populates="user", cascade="all, delete-orphan")
     summary_logs = relationship("SummaryLog", back_populates="user", cascade="all, delete-orphan")
     
@@ -153,7 +195,7 @@ class User(Base, TimestampMixin):
     @validates('email')
     def validate_email(self, key, email):
         if email:
-            email = email.lower().strip()
+            email = email.strip()
         return email
 
     def __repr__(self):
@@ -162,15 +204,17 @@ class User(Base, TimestampMixin):
 # ---------------------- USER SETTINGS ----------------------
 class UserSettings(Base, TimestampMixin):
     __tablename__ = "user_settings"
+    # Updated in place; stored with fillfactor=70 so updates can stay on the
+    # same page (set by migration a1c5e8f2b697)
     
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     therapist_name = Column(String)
     tone_preference = Column(String)
     pacing_preference = Column(String)
-    media_preference = Column(ARRAY(String), default=[])
+    media_preference = Column(ARRAY(String), default=list)
     learning_style = Column(String)
     active_core_agent = Column(String, default="EchoMind")
-    preferences = Column(JSON, default={})
+    preferences = Column(JSONB, default=dict)
     notifications_enabled = Column(Boolean, default=True)
 
     user = relationship("User", back_populates="settings")
@@ -182,8 +226,8 @@ class UserSettings(Base, TimestampMixin):
 class MemorySnapshot(Base, UserRelatedMixin, TimestampMixin):
     __tablename__ = "memory_snapshots"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    summary_text = Column(Text, nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    summary_text = Column(JSONB, nullable=False)
     memory_type = Column(String, default="general")
     is_shared = Column(Boolean, default=False)
     version = Column(Integer, default=1)
@@ -191,7 +235,7 @@ class MemorySnapshot(Base, UserRelatedMixin, TimestampMixin):
     user = relationship("User", back_populates="memory_snapshots")
     
     __table_args__ = (
-        Index('idx_memory_user_agent', 'user_id', 'agent'),
+        Index('idx_memory_user_agent_type_updated', 'user_id', 'agent', 'memory_type', 'updated_at'),
     )
     
     def __repr__(self):
@@ -201,8 +245,8 @@ class MemorySnapshot(Base, UserRelatedMixin, TimestampMixin):
 class SessionLog(Base, UserRelatedMixin, TimestampMixin):
     __tablename__ = "sessions"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    session_data = Column(JSON, nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    session_data = Column(JSONB, nullable=False)
     session_length = Column(Float)  # Duration in seconds
     session_tokens = Column(Integer)
     
@@ -219,18 +263,23 @@ class SessionLog(Base, UserRelatedMixin, TimestampMixin):
 class SummaryLog(Base, UserRelatedMixin, TimestampMixin):
     __tablename__ = "summary_logs"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     summary_text = Column(Text, nullable=False)
-    tags = Column(ARRAY(String), default=[])
+    tags = Column(ARRAY(String), default=list)
     emotional_tone = Column(String)
     confidence = Column(Float)
-    related_session_id = Column(String, ForeignKey("sessions.id", ondelete="SET NULL"))
+    related_session_id = Column(UUID(as_uuid=False), ForeignKey("sessions.id", ondelete="SET NULL"))
     
     user = relationship("User", back_populates="summary_logs")
     related_session = relationship("SessionLog")
     
     __table_args__ = (
         Index('idx_summary_user_timestamp', 'user_id', 'created_at'),
+        Index('idx_summary_user_agent_timestamp', 'user_id', 'agent', 'created_at'),
+        # Emotional memory reads only want rows with an emotional tone
+        Index('idx_summary_user_emotional_timestamp', 'user_id', 'created_at', postgresql_where=text('emotional_tone IS NOT NULL')),
+        # Tag filters should use overlap/containment (tags && ARRAY[...]) to hit this
+        Index('idx_summary_tags', 'tags', postgresql_using='gin', postgresql_ops={'tags': 'array_ops'}),
     )
     
     def __repr__(self):
@@ -240,8 +289,8 @@ class SummaryLog(Base, UserRelatedMixin, TimestampMixin):
 class SwitchLog(Base, TimestampMixin):
     __tablename__ = "switch_logs"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     from_agent = Column(String, nullable=False)
     to_agent = Column(String, nullable=False)
     reason = Column(Text)
@@ -260,21 +309,21 @@ class SwitchLog(Base, TimestampMixin):
 class Media(Base, TimestampMixin):
     __tablename__ = "media"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     title = Column(String, nullable=False)
     url = Column(String, nullable=False)
-    tags = Column(ARRAY(String), default=[])
+    tags = Column(ARRAY(String), default=list)
     agent = Column(String, nullable=False, default="EchoMind")
     media_type = Column(String, nullable=False)  # audio, video, image, pdf, etc.
     source = Column(String)
     description = Column(Text)
     duration = Column(Float)  # For audio/video, in seconds
-    user_id = Column(String, ForeignKey("users.id", ondelete="SET NULL"))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="SET NULL"))
     
     user = relationship("User")
     
     __table_args__ = (
-        Index('idx_media_type_tags', 'media_type', postgresql_using='gin', postgresql_ops={'tags': 'gin_array_ops'}),
+        Index('idx_media_tags', 'tags', postgresql_using='gin', postgresql_ops={'tags': 'array_ops'}),
     )
     
     def __repr__(self):
@@ -284,17 +333,18 @@ class Media(Base, TimestampMixin):
 class MilestoneLog(Base, UserRelatedMixin, TimestampMixin):
     __tablename__ = "milestone_logs"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     milestone_type = Column(Enum(MilestoneType), nullable=False)
     description = Column(Text, nullable=False)
     importance = Column(Integer, default=1)  # 1-5 scale
-    related_session_id = Column(String, ForeignKey("sessions.id", ondelete="SET NULL"))
+    related_session_id = Column(UUID(as_uuid=False), ForeignKey("sessions.id", ondelete="SET NULL"))
     
     user = relationship("User", back_populates="milestones")
     related_session = relationship("SessionLog")
     
     __table_args__ = (
         Index('idx_milestone_user_type', 'user_id', 'milestone_type'),
+        Index('idx_milestone_user_timestamp', 'user_id', 'created_at'),
     )
     
     def __repr__(self):
@@ -304,22 +354,30 @@ class MilestoneLog(Base, UserRelatedMixin, TimestampMixin):
 class Relationship(Base, TimestampMixin):
     __tablename__ = "relationships"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    user_a_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    user_b_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    user_a_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_b_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     relationship_type = Column(Enum(RelationshipType), nullable=False)
     approved = Column(Boolean, default=False, nullable=False)
     visibility_level = Column(Enum(VisibilityLevel), default=VisibilityLevel.summary, nullable=False)
-    visibility_rules = Column(JSON, default={})
+    visibility_rules = Column(JSONB, default=dict)
     notes = Column(Text)
+    # The pair in a fixed order, so (a, b) and (b, a) are the same key and a
+    # lookup for two users is one index probe instead of an OR of both orders
+    user_low = Column(UUID(as_uuid=False), Computed("LEAST(user_a_id, user_b_id)", persisted=True))
+    user_high = Column(UUID(as_uuid=False), Computed("GREATEST(user_a_id, user_b_id)", persisted=True))
     
     # Define relationships to both users
     user_a = relationship("User", foreign_keys=[user_a_id], back_populates="initiated_relationships")
     user_b = relationship("User", foreign_keys=[user_b_id], back_populates="received_relationships")
     
     __table_args__ = (
-        UniqueConstraint('user_a_id', 'user_b_id', 'relationship_type', name='uix_relationship'),
+        UniqueConstraint('user_low', 'user_high', 'relationship_type', name='uix_relationship_pair'),
+        # Per-user lookups and the ON DELETE CASCADE from users
         Index('idx_relationship_users', 'user_a_id', 'user_b_id'),
+        Index('idx_relationship_user_b', 'user_b_id'),
+        # Permission checks only look at approved relationships
+        Index('idx_relationship_approved_pair', 'user_low', 'user_high', postgresql_where=text('approved = true')),
     )
     
     def __repr__(self):
@@ -329,11 +387,11 @@ class Relationship(Base, TimestampMixin):
 class UserFeedback(Base, UserRelatedMixin, TimestampMixin):
     __tablename__ = "user_feedback"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     feedback_type = Column(Enum(FeedbackType), nullable=False)
     content = Column(Text, nullable=False)
     rating = Column(Integer)  # 1-5 scale
-    related_session_id = Column(String, ForeignKey("sessions.id", ondelete="SET NULL"))
+    related_session_id = Column(UUID(as_uuid=False), ForeignKey("sessions.id", ondelete="SET NULL"))
     status = Column(String, default="new")  # new, reviewed, implemented, rejected
     
     user = relationship("User")
@@ -349,14 +407,16 @@ class UserFeedback(Base, UserRelatedMixin, TimestampMixin):
 # ---------------------- USAGE STATS ----------------------
 class UsageStats(Base):
     __tablename__ = "usage_stats"
+    # Updated in place; stored with fillfactor=70 so updates can stay on the
+    # same page (set by migration a1c5e8f2b697)
     
-    id = Column(String, primary_key=True, default=gen_id)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False, default=func.current_date())
     sessions_count = Column(Integer, default=0)
     total_tokens = Column(Integer, default=0)
     total_session_time = Column(Float, default=0.0)  # In seconds
-    agents_used = Column(ARRAY(String), default=[])
+    agents_used = Column(ARRAY(String), default=list)
     
     user = relationship("User", back_populates="usage_stats")
     
@@ -371,23 +431,23 @@ class UsageStats(Base):
 class AgentDefinition(Base, TimestampMixin):
     __tablename__ = "agent_definitions"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     name = Column(String, nullable=False, unique=True)
     display_name = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     type = Column(Enum(AgentType), nullable=False)
     system_prompt = Column(Text, nullable=False)
     tone_profile = Column(JSON, nullable=False)
-    capabilities = Column(ARRAY(String), default=[])
+    capabilities = Column(ARRAY(String), default=list)
     emoji = Column(String)
     version = Column(String, nullable=False, default="1.0.0")
     is_active = Column(Boolean, default=True)
     
     # Reference to the personality profile used by this agent
-    personality_profile_id = Column(String, ForeignKey("personality_profiles.id", ondelete="SET NULL"))
+    personality_profile_id = Column(UUID(as_uuid=False), ForeignKey("personality_profiles.id", ondelete="SET NULL"))
     
     # Agents should be versioned, and this allows for referencing previous versions
-    previous_version_id = Column(String, ForeignKey("agent_definitions.id", ondelete="SET NULL"))
+    previous_version_id = Column(UUID(as_uuid=False), ForeignKey("agent_definitions.id", ondelete="SET NULL"))
     
     # Relationship to previous version
     previous_version = relationship("AgentDefinition", remote_side=[id])
@@ -446,13 +506,13 @@ class PersonalityProfile(Base, TimestampMixin):
     """Database model for personality profiles."""
     __tablename__ = "personality_profiles"
     
-    id = Column(String, primary_key=True, default=gen_id)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     
     # Primary attributes
     primary_traits = Column(ARRAY(String), nullable=False)
-    secondary_traits = Column(ARRAY(String), default=[])
+    secondary_traits = Column(ARRAY(String), default=list)
     communication_style = Column(Enum(CommunicationStyle), nullable=False)
     emotional_tone = Column(Enum(EmotionalTone), nullable=False)
     
@@ -469,7 +529,7 @@ class PersonalityProfile(Base, TimestampMixin):
     adaptation_rate = Column(Float, default=0.2)
     
     # Prompt modifiers
-    prompt_modifiers = Column(JSON, default={})
+    prompt_modifiers = Column(JSON, default=dict)
     
     # System fields
     is_system = Column(Boolean, default=False)
@@ -488,11 +548,11 @@ class UserPersonalityPreference(Base, TimestampMixin):
     """Records user preferences for agent personalities."""
     __tablename__ = "user_personality_preferences"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Preferred personality traits and settings
-    preferred_traits = Column(ARRAY(String), default=[])
+    preferred_traits = Column(ARRAY(String), default=list)
     communication_style_preference = Column(Enum(CommunicationStyle))
     emotional_tone_preference = Column(Enum(EmotionalTone))
     verbosity_preference = Column(Float)
@@ -500,7 +560,7 @@ class UserPersonalityPreference(Base, TimestampMixin):
     formality_preference = Column(Float)
     
     # Agent-specific preferences
-    agent_specific_preferences = Column(JSON, default={})
+    agent_specific_preferences = Column(JSON, default=dict)
     
     # Relationship
     user = relationship("User", back_populates="personality_preferences")
@@ -516,21 +576,21 @@ class PersonalityAdaptation(Base, TimestampMixin):
     """Tracks adaptations to personality profiles for specific users."""
     __tablename__ = "personality_adaptations"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     agent_type = Column(Enum(AgentType), nullable=False)
-    base_profile_id = Column(String, ForeignKey("personality_profiles.id", ondelete="CASCADE"), nullable=False)
+    base_profile_id = Column(UUID(as_uuid=False), ForeignKey("personality_profiles.id", ondelete="CASCADE"), nullable=False)
     
     # Adapted parameters
     adapted_traits = Column(ARRAY(String))
     adapted_verbosity = Column(Float)
     adapted_technical_level = Column(Float)
     adapted_formality = Column(Float)
-    adapted_prompt_modifiers = Column(JSON, default={})
+    adapted_prompt_modifiers = Column(JSON, default=dict)
     
     # Adaptation metadata
     adaptation_reason = Column(Text)
-    interaction_metrics = Column(JSON, default={})
+    interaction_metrics = Column(JSON, default=dict)
     
     # Relationships
     user = relationship("User", back_populates="personality_adaptations")
@@ -548,12 +608,12 @@ class PersonalityAdaptation(Base, TimestampMixin):
 class BridgeSession(Base, TimestampMixin):
     __tablename__ = "bridge_sessions"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    initiator_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    participant_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    initiator_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    participant_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     status = Column(Enum(BridgeStatus), default=BridgeStatus.pending, nullable=False)
     topic = Column(String)
-    context = Column(JSON, default={})
+    context = Column(JSON, default=dict)
     memory_timeframe_start = Column(DateTime(timezone=True))
     memory_timeframe_end = Column(DateTime(timezone=True))
     intervention_level = Column(Integer, default=2)  # 1-5 scale, with 1 being minimal and 5 being maximal
@@ -579,9 +639,9 @@ class BridgeSession(Base, TimestampMixin):
 class BridgeMessage(Base, TimestampMixin):
     __tablename__ = "bridge_messages"
     
-    id = Column(String, primary_key=True, default=gen_id)
-    session_id = Column(String, ForeignKey("bridge_sessions.id", ondelete="CASCADE"), nullable=False)
-    sender_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=gen_id)
+    session_id = Column(UUID(as_uuid=False), ForeignKey("bridge_sessions.id", ondelete="CASCADE"), nullable=False)
+    sender_id = Column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     original_text = Column(Text, nullable=False)
     translated_text = Column(Text)
     emotional_tone = Column(String)
@@ -0,0 +1,57 @@
+"""
+Router Registry
+
+This module lists every API router together with the URL prefix and
+OpenAPI tag it is mounted under.
+"""
+
+from app.routes import (
+    admin_stats_route,
+    agent,
+    auth,
+    capsule_preview_route,
+    claude_code,
+    code,
+    frontend,
+    health,
+    knowledge,
+    log_milestone_route,
+    log_session_route,
+    log_summary_route,
+    memory,
+    memory_visualization,
+    milestone,
+    personality,
+    pickaxe,
+    privacy,
+    relationship,
+    session,
+    summary,
+    websocket,
+)
+
+# (router, prefix, tag) for each router mounted by create_app
+ALL_ROUTERS = (
+    (code.router, "/code", "Code Execution"),
+    (claude_code.router, "/claude-code", "Claude Code"),
+    (health.router, "", "Health"),
+    (session.router, "/session", "Sessions"),
+    (summary.router, "/summary", "Summaries"),
+    (milestone.router, "/milestone", "Milestones"),
+    (memory.router, "/memory", "Memory"),
+    (memory_visualization.router, "/memory", "Memory Visualization"),
+    (personality.router, "/personality", "Personality"),
+    (auth.router, "/auth", "Authentication"),
+    (privacy.router, "/privacy", "Privacy"),
+    (log_session_route.router, "/log-session", "Logging"),
+    (log_summary_route.router, "/log-summary", "Logging"),
+    (log_milestone_route.router, "/log-milestone", "Logging"),
+    (admin_stats_route.router, "/admin", "Admin"),
+    (capsule_preview_route.router, "/capsule", "Capsule"),
+    (pickaxe.router, "/pickaxe", "Pickaxe"),
+    (websocket.router, "", "WebSocket"),
+    (frontend.router, "/frontend", "Frontend"),
+    (knowledge.router, "/knowledge", "Knowledge"),
+    (agent.router, "/agent", "Agent"),
+    (relationship.router, "/relationship", "Relationships"),
+)
@@ -1,26 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import ADMIN_STATS_KEY, ADMIN_STATS_TTL, response_cache
 from app.database import get_db
 from app.get_api_key import get_api_key
 from app.models import MilestoneLog, SessionLog, SummaryLog, User
 
 router = APIRouter()
 
+def _row_count(model):
+    """Scalar subquery counting the rows in a model's table"""
+    return select(func.count()).select_from(model).scalar_subquery()
+
+# All four totals in a single round trip
+ADMIN_STATS = select(
+    _row_count(User).label("users"),
+    _row_count(SessionLog).label("sessions"),
+    _row_count(MilestoneLog).label("milestones"),
+    _row_count(SummaryLog).label("summaries")
+)
+
 @router.get("/admin/stats")
 async def get_admin_stats(db: AsyncSession = Depends(get_db), api_key: str = Depends(get_api_key)):
-    try:
-        total_users = await db.scalar(select(func.count()).select_from(User))
-        total_sessions = await db.scalar(select(func.count()).select_from(SessionLog))
-        total_milestones = await db.scalar(select(func.count()).select_from(MilestoneLog))
-        total_summaries = await db.scalar(select(func.count()).select_from(SummaryLog))
+    cached = response_cache.get(ADMIN_STATS_KEY)
+    if cached is not None:
+        return cached
 
-        return {
-            "users": total_users,
-            "sessions": total_sessions,
-            "milestones": total_milestones,
-            "summaries": total_summaries
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await db.execute(ADMIN_STATS)
+    stats = dict(result.one()._mapping)
+    response_cache.set(ADMIN_STATS_KEY, stats, ttl=ADMIN_STATS_TTL)
+    return stats
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Body
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from datetime import datetime
@@ -10,7 +10,7 @@ import os
 import json
 import logging
 
-from app.database import get_db
+from app.database import get_db, is_uuid
 from app.get_api_key import get_api_key
 from app.models import SessionLog
 
@@ -33,8 +33,8 @@ class ClaudeCodeRequest(BaseModel):
     temperature: Optional[float] = Field(0.7, description="Temperature for generation", ge=0, le=1)
     top_p: Optional[float] = Field(0.9, description="Top-p for generation", ge=0, le=1)
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user123",
                 "prompt": "Can you write a function to calculate the Fibonacci sequence?",
@@ -42,6 +42,7 @@ class ClaudeCodeRequest(BaseModel):
                 "temperature": 0.7
             }
         }
+    )
     
 class ClaudeCodeResponse(BaseModel):
     """
@@ -51,8 +52,8 @@ class ClaudeCodeResponse(BaseModel):
     conversation_id: str = Field(..., description="Conversation ID that can be used for follow-ups")
     response: Dict[str, Any] = Field(..., description="Claude's response")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "execution_id": "550e8400-e29b-41d4-a716-446655440000",
                 "conversation_id": "conv_123456789",
@@ -76,6 +77,7 @@ class ClaudeCodeResponse(BaseModel):
                 }
             }
         }
+    )
 
 class ExecutionListResponse(BaseModel):
     """
@@ -83,8 +85,8 @@ class ExecutionListResponse(BaseModel):
     """
     executions: List[Dict[str, Any]] = Field(..., description="List of Claude Code executions")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "executions": [
                     {
@@ -96,6 +98,7 @@ class ExecutionListResponse(BaseModel):
                 ]
             }
         }
+    )
 
 class ExecutionDetailResponse(BaseModel):
     """
@@ -109,8 +112,8 @@ class ExecutionDetailResponse(BaseModel):
     timestamp: str = Field(..., description="Execution timestamp")
     conversation_id: Optional[str] = Field(None, description="Conversation ID")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "user_id": "user123",
@@ -132,6 +135,7 @@ class ExecutionDetailResponse(BaseModel):
                 "conversation_id": "conv_123456789"
             }
         }
+    )
 
 @router.get("/ping", 
             summary="Health Check",
@@ -331,7 +335,7 @@ async def get_claude_code_execution(
     - Conversation ID for follow-ups
     """
     try:
-        session = await db.get(SessionLog, execution_id)
+        session = await db.get(SessionLog, execution_id) if is_uuid(execution_id) else None
         if not session or session.agent != "ClaudeCode":
             raise HTTPException(status_code=404, detail="Claude Code execution not found")
             
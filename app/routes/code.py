@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from datetime import datetime
 from sqlalchemy import select
 from typing import Dict, Any, List, Optional
 
-from app.database import get_db
+from app.database import get_db, is_uuid
 from app.get_api_key import get_api_key
 from app.models import SessionLog
 from app.code_execution import execute_python_code
@@ -22,8 +22,8 @@ class CodeExecutionRequest(BaseModel):
     language: str = Field("python", description="Programming language (only Python supported for now)")
     context: Dict[str, Any] = Field({}, description="Optional context variables for code execution")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user123",
                 "code": "print('Hello, world!')\nx = 5\ny = 10\nprint(f'Sum: {x + y}')",
@@ -31,6 +31,7 @@ class CodeExecutionRequest(BaseModel):
                 "context": {"input_value": 42}
             }
         }
+    )
     
 class CodeExecutionResponse(BaseModel):
     """
@@ -41,8 +42,8 @@ class CodeExecutionResponse(BaseModel):
     execution_time: float = Field(..., description="Time taken to execute the code in seconds")
     status: str = Field(..., description="Execution status: 'success' or 'error'")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "result": {
                     "stdout": "Hello, world!\nSum: 15\n",
@@ -55,6 +56,7 @@ class CodeExecutionResponse(BaseModel):
                 "status": "success"
             }
         }
+    )
 
 class ExecutionListResponse(BaseModel):
     """
@@ -62,8 +64,8 @@ class ExecutionListResponse(BaseModel):
     """
     executions: List[Dict[str, Any]] = Field(..., description="List of code execution summaries")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "executions": [
                     {
@@ -75,6 +77,7 @@ class ExecutionListResponse(BaseModel):
                 ]
             }
         }
+    )
 
 class ExecutionDetailResponse(BaseModel):
     """
@@ -87,8 +90,8 @@ class ExecutionDetailResponse(BaseModel):
     result: Dict[str, Any] = Field(..., description="Execution result")
     timestamp: str = Field(..., description="Execution timestamp")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "user_id": "user123",
@@ -103,6 +106,7 @@ class ExecutionDetailResponse(BaseModel):
                 "timestamp": "2023-05-05T10:30:00.000Z"
             }
         }
+    )
 
 @router.get("/ping", 
             summary="Health Check",
@@ -239,7 +243,7 @@ async def get_execution(
     - Execution timestamp
     """
     try:
-        session = await db.get(SessionLog, execution_id)
+        session = await db.get(SessionLog, execution_id) if is_uuid(execution_id) else None
         if not session or session.agent != "ClaudeCode":
             raise HTTPException(status_code=404, detail="Execution not found")
             
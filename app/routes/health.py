@@ -1,7 +1,20 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
 
 router = APIRouter()
 
+# Constant liveness response, serialized once
+_HEALTHY_BODY = orjson.dumps({"status": "healthy"})
+
 @router.get("/healthz")
 async def health_check():
-    return {"status": "healthy"}
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
+
+@router.get("/healthz/db")
+async def db_health_check(db: AsyncSession = Depends(get_db)):
+    await db.execute(text("SELECT 1"))
+    return {"status": "healthy", "database": "ok"}
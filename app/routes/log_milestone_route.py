@@ -1,35 +1,29 @@
 import uuid
-from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.batch_writer import milestone_log_batcher
 from app.get_api_key import get_api_key
-from app.models import MilestoneLog, MilestoneType
+from app.models import MilestoneType
 
 router = APIRouter()
 
 class MilestoneInput(BaseModel):
-    user_id: str
+    # Parsed as a UUID so a row that can't be inserted is rejected with a
+    # 422 here rather than queued and dropped by the batcher
+    user_id: uuid.UUID
     agent: str
     type: MilestoneType
     description: str
 
 @router.post("/log-milestone")
-async def log_milestone(data: MilestoneInput, db: AsyncSession = Depends(get_db), api_key: str = Depends(get_api_key)):
-    try:
-        milestone = MilestoneLog(
-            id=str(uuid.uuid4()),
-            user_id=data.user_id,
-            agent=data.agent,
-            type=data.type,
-            description=data.description,
-            timestamp=datetime.utcnow()
-        )
-        db.add(milestone)
-        await db.commit()
-        return {"status": "ok"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+async def log_milestone(data: MilestoneInput, api_key: str = Depends(get_api_key)):
+    # Written by the batcher shortly after; see app.batch_writer
+    await milestone_log_batcher.put({
+        "user_id": str(data.user_id),
+        "agent": data.agent,
+        "milestone_type": data.type,
+        "description": data.description
+    })
+    return {"status": "queued"}
@@ -4,18 +4,29 @@ Memory API endpoints
 This module provides API endpoints for creating, reading, updating, and deleting memory.
 """
 
-from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Body
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import String, and_, bindparam, case, func, insert, literal, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.database import get_db
+from app.cache import (
+    ADMIN_STATS_KEY,
+    MEMORY_SNAPSHOT_TTL,
+    cache_emotion_summaries,
+    emotion_summary_key,
+    invalidate_emotion_summaries,
+    memory_snapshot_key,
+    response_cache
+)
+from app.database import db_error_status, get_db, is_uuid, user_exists
 from app.get_api_key import get_api_key
-from app.models import MemorySnapshot, SummaryLog, User
+from app.models import MemorySnapshot, SummaryLog, User, gen_id
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -31,8 +42,8 @@ class MemoryCreateRequest(BaseModel):
     memory_type: str = Field("general", description="Type of memory (general, emotional, etc.)")
     content: Dict[str, Any] = Field(..., description="Memory content")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user123",
                 "agent": "Therapist",
@@ -44,6 +55,7 @@ class MemoryCreateRequest(BaseModel):
                 }
             }
         }
+    )
 
 class MemoryUpdateRequest(BaseModel):
     """Request model for updating memory"""
@@ -53,8 +65,8 @@ class MemoryUpdateRequest(BaseModel):
     path: str = Field(..., description="Path to the memory to update (e.g. 'topics[0]')")
     content: Any = Field(..., description="New content for the specified path")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user123",
                 "agent": "Therapist",
@@ -63,6 +75,7 @@ class MemoryUpdateRequest(BaseModel):
                 "content": ["Practice deep breathing exercises", "Set firm boundaries at work"]
             }
         }
+    )
 
 class EmotionalMemory(BaseModel):
     """Model for emotional memory entry"""
@@ -72,8 +85,8 @@ class EmotionalMemory(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Tags for categorization")
     timestamp: str = Field(..., description="When this emotional state was recorded")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "emotional_tone": "anxiety",
                 "confidence": 0.85,
@@ -82,6 +95,7 @@ class EmotionalMemory(BaseModel):
                 "timestamp": "2023-05-05T10:30:00.000Z"
             }
         }
+    )
 
 class EmotionalMemoryCreateRequest(BaseModel):
     """Request model for creating emotional memory"""
@@ -92,8 +106,8 @@ class EmotionalMemoryCreateRequest(BaseModel):
     summary_text: str = Field(..., description="Summary related to the emotional state")
     tags: List[str] = Field(default_factory=list, description="Tags for categorization")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user123",
                 "agent": "Therapist",
@@ -103,6 +117,7 @@ class EmotionalMemoryCreateRequest(BaseModel):
                 "tags": ["anxiety", "work", "interview"]
             }
         }
+    )
 
 class MemoryResponse(BaseModel):
     """Standard memory response model"""
@@ -110,8 +125,8 @@ class MemoryResponse(BaseModel):
     message: Optional[str] = Field(None, description="Response message")
     data: Optional[Dict[str, Any]] = Field(None, description="Response data")
     
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "ok",
                 "message": "Memory created successfully",
@@ -121,6 +136,80 @@ class MemoryResponse(BaseModel):
                 }
             }
         }
+    )
+
+# ----------------------------- Statements -----------------------------
+# Built once at import time; values are bound per request
+
+# User row outer-joined to their latest matching snapshot (NULL if none)
+LATEST_MEMORY_WITH_USER = select(User.id, MemorySnapshot).outerjoin(
+    MemorySnapshot,
+    and_(
+        MemorySnapshot.user_id == User.id,
+        MemorySnapshot.agent == bindparam("agent"),
+        MemorySnapshot.memory_type == bindparam("memory_type")
+    )
+).where(User.id == bindparam("user_id")).order_by(
+    MemorySnapshot.updated_at.desc().nulls_last()
+).limit(1)
+
+# Merge {path: content} into the latest snapshot (replacing non-object
+# content), or insert a new snapshot when there is none. Returns the
+# snapshot id and whether it was an "update" or a "create".
+_latest_memory_id = select(MemorySnapshot.id).where(
+    MemorySnapshot.user_id == bindparam("user_id"),
+    MemorySnapshot.agent == bindparam("agent"),
+    MemorySnapshot.memory_type == bindparam("memory_type")
+).order_by(MemorySnapshot.updated_at.desc()).limit(1).scalar_subquery()
+
+_path_content = func.jsonb_build_object(
+    bindparam("path", type_=String),
+    bindparam("content", type_=JSONB)
+)
+
+_updated_memory = update(MemorySnapshot).where(
+    MemorySnapshot.id == _latest_memory_id
+).values(
+    summary_text=case(
+        (func.jsonb_typeof(MemorySnapshot.summary_text) == "object", MemorySnapshot.summary_text),
+        else_=func.jsonb_build_object()
+    ).op("||", return_type=JSONB)(_path_content)
+).returning(MemorySnapshot.id, MemorySnapshot.updated_at).cte("updated_memory")
+
+_inserted_memory = insert(MemorySnapshot).from_select(
+    ["id", "user_id", "agent", "memory_type", "summary_text"],
+    select(
+        bindparam("new_id", type_=UUID(as_uuid=False)),
+        bindparam("user_id", type_=UUID(as_uuid=False)),
+        bindparam("agent", type_=String),
+        bindparam("memory_type", type_=String),
+        _path_content
+    ).where(~select(_updated_memory.c.id).exists())
+).returning(MemorySnapshot.id, MemorySnapshot.updated_at).cte("inserted_memory")
+
+# Timestamps come from the database (column defaults on insert, the
+# touch_updated_at() trigger on update), as in create_memory
+UPSERT_MEMORY_PATH = select(
+    _updated_memory.c.id, literal("update").label("operation"), _updated_memory.c.updated_at
+).union_all(
+    select(_inserted_memory.c.id, literal("create").label("operation"), _inserted_memory.c.updated_at)
+)
+
+# Most recent emotional summaries, optionally narrowed to one agent
+EMOTIONAL_SUMMARIES = select(
+    SummaryLog.id,
+    SummaryLog.emotional_tone,
+    SummaryLog.confidence,
+    SummaryLog.summary_text.label("summary"),
+    SummaryLog.tags,
+    SummaryLog.created_at.label("timestamp"),
+    SummaryLog.agent
+).where(
+    SummaryLog.user_id == bindparam("user_id"),
+    SummaryLog.emotional_tone.isnot(None)
+).order_by(SummaryLog.created_at.desc()).limit(bindparam("limit"))
+
+EMOTIONAL_SUMMARIES_FOR_AGENT = EMOTIONAL_SUMMARIES.where(SummaryLog.agent == bindparam("agent"))
 
 # ----------------------------- Endpoints -----------------------------
 
@@ -145,29 +234,23 @@ async def create_memory(
     """
     try:
         # Verify user exists
-        user = await db.get(User, request.user_id)
-        if not user:
+        if not await user_exists(db, request.user_id):
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Create memory snapshot
-        memory_id = str(uuid4())
-        timestamp = datetime.utcnow()
+        # Create memory snapshot; timestamps come from the server defaults
+        memory_id = gen_id()
         
-        import json
-        memory_content = json.dumps(request.content)
-        
-        memory = MemorySnapshot(
-            id=memory_id,
-            user_id=request.user_id,
-            agent=request.agent,
-            memory_type=request.memory_type,
-            summary_text=memory_content,
-            created_at=timestamp,
-            updated_at=timestamp
+        timestamp = await db.scalar(
+            insert(MemorySnapshot).values(
+                id=memory_id,
+                user_id=request.user_id,
+                agent=request.agent,
+                memory_type=request.memory_type,
+                summary_text=request.content
+            ).returning(MemorySnapshot.created_at)
         )
-        
-        db.add(memory)
         await db.commit()
+        response_cache.delete(memory_snapshot_key(request.user_id, request.agent, request.memory_type))
         
         logger.info(
             f"Created memory for user {request.user_id}",
@@ -188,6 +271,18 @@ async def create_memory(
             }
         )
         
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error creating memory: {str(e)}",
+            extra={
+                "user_id": request.user_id,
+                "agent": request.agent,
+                "memory_type": request.memory_type
+            }
+        )
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error creating memory: {str(e)}",
@@ -198,13 +293,9 @@ async def create_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error creating memory: {str(e)}")
 
-@router.get("/get/{user_id}", response_model=MemoryResponse,
+@router.get("/get/{user_id}", responses={200: {"model": MemoryResponse}},
           summary="Get Memory",
           description="Get a user's memory for a specific agent")
 async def get_memory(
@@ -219,50 +310,66 @@ async def get_memory(
     
     Retrieves the most recent memory snapshot for the specified user and agent.
     """
+    if not is_uuid(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    cache_key = memory_snapshot_key(user_id, agent, memory_type)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     try:
-        # Verify user exists
-        user = await db.get(User, user_id)
-        if not user:
+        # Look up the user and their latest snapshot in one round-trip; the
+        # outer join yields a row with a NULL snapshot when the user exists
+        # but has no matching memory
+        result = await db.execute(
+            LATEST_MEMORY_WITH_USER,
+            {"user_id": user_id, "agent": agent, "memory_type": memory_type}
+        )
+        row = result.first()
+        if row is None:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Get memory snapshot
-        query = select(MemorySnapshot).where(
-            MemorySnapshot.user_id == user_id,
-            MemorySnapshot.agent == agent,
-            MemorySnapshot.memory_type == memory_type
-        ).order_by(MemorySnapshot.updated_at.desc()).limit(1)
-        
-        result = await db.execute(query)
-        memory = result.scalars().first()
+        _, memory = row
         
         if not memory:
-            return MemoryResponse(
-                status="ok",
-                message=f"No {memory_type} memory found for user {user_id} and agent {agent}",
-                data={
+            response = {
+                "status": "ok",
+                "message": f"No {memory_type} memory found for user {user_id} and agent {agent}",
+                "data": {
                     "memory": None
                 }
-            )
-        
-        # Parse memory content
-        try:
-            import json
-            memory_content = json.loads(memory.summary_text)
-        except json.JSONDecodeError:
-            memory_content = memory.summary_text
+            }
+            response_cache.set(cache_key, response, ttl=MEMORY_SNAPSHOT_TTL)
+            return ORJSONResponse(response)
         
-        return MemoryResponse(
-            status="ok",
-            data={
+        response = {
+            "status": "ok",
+            "message": None,
+            "data": {
                 "memory_id": memory.id,
                 "memory_type": memory.memory_type,
                 "agent": memory.agent,
                 "created_at": memory.created_at.isoformat(),
                 "updated_at": memory.updated_at.isoformat(),
-                "content": memory_content
+                "content": memory.summary_text
+            }
+        }
+        response_cache.set(cache_key, response, ttl=MEMORY_SNAPSHOT_TTL)
+        return ORJSONResponse(response)
+        
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error getting memory: {str(e)}",
+            extra={
+                "user_id": user_id,
+                "agent": agent,
+                "memory_type": memory_type
             }
         )
-        
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error getting memory: {str(e)}",
@@ -273,10 +380,6 @@ async def get_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error getting memory: {str(e)}")
 
 @router.post("/update", response_model=MemoryResponse,
@@ -295,42 +398,27 @@ async def update_memory(
     """
     try:
         # Verify user exists
-        user = await db.get(User, request.user_id)
-        if not user:
+        if not await user_exists(db, request.user_id):
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Get memory snapshot
-        query = select(MemorySnapshot).where(
-            MemorySnapshot.user_id == request.user_id,
-            MemorySnapshot.agent == request.agent,
-            MemorySnapshot.memory_type == request.memory_type
-        ).order_by(MemorySnapshot.updated_at.desc()).limit(1)
-        
-        result = await db.execute(query)
-        memory = result.scalars().first()
-        
-        timestamp = datetime.utcnow()
+        # Merge the path into the latest snapshot, or create one, in a single
+        # statement so concurrent updates can't overwrite each other
+        result = await db.execute(
+            UPSERT_MEMORY_PATH,
+            {
+                "user_id": request.user_id,
+                "agent": request.agent,
+                "memory_type": request.memory_type,
+                "path": request.path,
+                "content": request.content,
+                "new_id": gen_id()
+            }
+        )
+        memory_id, operation, timestamp = result.one()
+        await db.commit()
+        response_cache.delete(memory_snapshot_key(request.user_id, request.agent, request.memory_type))
         
-        if not memory:
-            # Create new memory if none exists
-            memory_id = str(uuid4())
-            import json
-            memory_content = {request.path: request.content}
-            memory_json = json.dumps(memory_content)
-            
-            memory = MemorySnapshot(
-                id=memory_id,
-                user_id=request.user_id,
-                agent=request.agent,
-                memory_type=request.memory_type,
-                summary_text=memory_json,
-                created_at=timestamp,
-                updated_at=timestamp
-            )
-            
-            db.add(memory)
-            await db.commit()
-            
+        if operation == "create":
             logger.info(
                 f"Created new memory during update for user {request.user_id}",
                 extra={
@@ -352,31 +440,13 @@ async def update_memory(
                 }
             )
         
-        # Update existing memory
-        try:
-            import json
-            memory_content = json.loads(memory.summary_text)
-        except json.JSONDecodeError:
-            memory_content = {}
-        
-        # Update path
-        # For simplicity, we're just replacing at the top level
-        # A more advanced implementation could handle nested paths like 'topics[0]'
-        memory_content[request.path] = request.content
-        
-        # Update memory
-        memory.summary_text = json.dumps(memory_content)
-        memory.updated_at = timestamp
-        
-        await db.commit()
-        
         logger.info(
             f"Updated memory for user {request.user_id}",
             extra={
                 "user_id": request.user_id,
                 "agent": request.agent,
                 "memory_type": request.memory_type,
-                "memory_id": memory.id,
+                "memory_id": memory_id,
                 "path": request.path
             }
         )
@@ -385,12 +455,25 @@ async def update_memory(
             status="ok",
             message="Memory updated successfully",
             data={
-                "memory_id": memory.id,
+                "memory_id": memory_id,
                 "timestamp": timestamp.isoformat(),
                 "operation": "update"
             }
         )
         
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error updating memory: {str(e)}",
+            extra={
+                "user_id": request.user_id,
+                "agent": request.agent,
+                "memory_type": request.memory_type,
+                "path": request.path
+            }
+        )
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error updating memory: {str(e)}",
@@ -402,10 +485,6 @@ async def update_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error updating memory: {str(e)}")
 
 @router.post("/emotional", response_model=MemoryResponse,
@@ -424,27 +503,27 @@ async def create_emotional_memory(
     """
     try:
         # Verify user exists
-        user = await db.get(User, request.user_id)
-        if not user:
+        if not await user_exists(db, request.user_id):
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Create summary log for emotional memory
-        memory_id = str(uuid4())
-        timestamp = datetime.utcnow()
+        # Create summary log for emotional memory; timestamps come from the
+        # server defaults
+        memory_id = gen_id()
         
-        summary = SummaryLog(
-            id=memory_id,
-            user_id=request.user_id,
-            agent=request.agent,
-            summary_text=request.summary_text,
-            emotional_tone=request.emotional_tone,
-            confidence=request.confidence,
-            tags=request.tags,
-            timestamp=timestamp
+        timestamp = await db.scalar(
+            insert(SummaryLog).values(
+                id=memory_id,
+                user_id=request.user_id,
+                agent=request.agent,
+                summary_text=request.summary_text,
+                emotional_tone=request.emotional_tone,
+                confidence=request.confidence,
+                tags=request.tags
+            ).returning(SummaryLog.created_at)
         )
-        
-        db.add(summary)
         await db.commit()
+        response_cache.delete(ADMIN_STATS_KEY)
+        invalidate_emotion_summaries(request.user_id)
         
         logger.info(
             f"Created emotional memory for user {request.user_id}",
@@ -465,6 +544,18 @@ async def create_emotional_memory(
             }
         )
         
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error creating emotional memory: {str(e)}",
+            extra={
+                "user_id": request.user_id,
+                "agent": request.agent,
+                "emotional_tone": request.emotional_tone
+            }
+        )
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error creating emotional memory: {str(e)}",
@@ -475,19 +566,15 @@ async def create_emotional_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error creating emotional memory: {str(e)}")
 
-@router.get("/emotional/{user_id}", response_model=MemoryResponse,
+@router.get("/emotional/{user_id}", responses={200: {"model": MemoryResponse}},
           summary="Get Emotional Memory",
           description="Get a user's emotional memory history")
 async def get_emotional_memory(
     user_id: str = Path(..., description="User's unique identifier"),
     agent: Optional[str] = Query(None, description="Filter by agent (optional)"),
-    limit: int = Query(10, description="Maximum number of entries to return"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of entries to return"),
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(get_api_key)
 ):
@@ -497,54 +584,60 @@ async def get_emotional_memory(
     Retrieves the user's emotional memory history.
     Returns a list of emotional memory entries, ordered by most recent first.
     """
+    # Serve repeated reads from the cache; see app.cache for how writes
+    # invalidate every agent/limit variant for the user
+    cache_key = emotion_summary_key(user_id, agent, limit)
+    cached = response_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     try:
         # Verify user exists
-        user = await db.get(User, user_id)
-        if not user:
+        if not await user_exists(db, user_id):
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Query for emotional summaries
-        query = select(SummaryLog).where(
-            SummaryLog.user_id == user_id,
-            SummaryLog.emotional_tone.isnot(None)
-        ).order_by(SummaryLog.timestamp.desc()).limit(limit)
-        
+        # Query for emotional summaries, selecting only the returned columns
         if agent:
-            query = query.where(SummaryLog.agent == agent)
-        
-        result = await db.execute(query)
-        summaries = result.scalars().all()
+            result = await db.execute(
+                EMOTIONAL_SUMMARIES_FOR_AGENT,
+                {"user_id": user_id, "agent": agent, "limit": limit}
+            )
+        else:
+            result = await db.execute(EMOTIONAL_SUMMARIES, {"user_id": user_id, "limit": limit})
+        emotional_memories = [dict(row) for row in result.mappings()]
         
-        if not summaries:
-            return MemoryResponse(
-                status="ok",
-                message=f"No emotional memory found for user {user_id}",
-                data={
+        if not emotional_memories:
+            response = {
+                "status": "ok",
+                "message": f"No emotional memory found for user {user_id}",
+                "data": {
                     "memories": []
                 }
-            )
-        
-        # Format emotional memories
-        emotional_memories = [
-            {
-                "id": s.id,
-                "emotional_tone": s.emotional_tone,
-                "confidence": s.confidence,
-                "summary": s.summary_text,
-                "tags": s.tags,
-                "timestamp": s.timestamp.isoformat(),
-                "agent": s.agent
             }
-            for s in summaries
-        ]
+            cache_emotion_summaries(user_id, agent, limit, response)
+            return ORJSONResponse(response)
         
-        return MemoryResponse(
-            status="ok",
-            data={
+        response = {
+            "status": "ok",
+            "message": None,
+            "data": {
                 "memories": emotional_memories
             }
+        }
+        cache_emotion_summaries(user_id, agent, limit, response)
+        return ORJSONResponse(response)
+        
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error getting emotional memory: {str(e)}",
+            extra={
+                "user_id": user_id,
+                "agent": agent
+            }
         )
-        
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error getting emotional memory: {str(e)}",
@@ -554,10 +647,6 @@ async def get_emotional_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error getting emotional memory: {str(e)}")
 
 @router.delete("/{memory_id}", response_model=MemoryResponse,
@@ -576,25 +665,29 @@ async def delete_memory(
     The memory type parameter determines which memory store to delete from.
     """
     try:
+        # Cache entries are dropped after each commit, so a concurrent read
+        # can't cache the row again before it's gone
         if memory_type == "emotional":
             # Delete from SummaryLog
-            memory = await db.get(SummaryLog, memory_id)
+            memory = await db.get(SummaryLog, memory_id) if is_uuid(memory_id) else None
             if not memory:
                 raise HTTPException(status_code=404, detail="Emotional memory not found")
             
             user_id = memory.user_id
             await db.delete(memory)
+            await db.commit()
+            invalidate_emotion_summaries(user_id)
             
         else:
             # Delete from MemorySnapshot
-            memory = await db.get(MemorySnapshot, memory_id)
+            memory = await db.get(MemorySnapshot, memory_id) if is_uuid(memory_id) else None
             if not memory:
                 raise HTTPException(status_code=404, detail="Memory not found")
             
             user_id = memory.user_id
             await db.delete(memory)
-        
-        await db.commit()
+            await db.commit()
+            response_cache.delete(memory_snapshot_key(user_id, memory.agent, memory.memory_type))
         
         logger.info(
             f"Deleted {memory_type} memory {memory_id}",
@@ -610,6 +703,17 @@ async def delete_memory(
             message=f"{memory_type.capitalize()} memory deleted successfully"
         )
         
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.warning(
+            f"Database error deleting memory: {str(e)}",
+            extra={
+                "memory_id": memory_id,
+                "memory_type": memory_type
+            }
+        )
+        raise HTTPException(status_code=db_error_status(e), detail="Database error")
     except Exception as e:
         logger.error(
             f"Error deleting memory: {str(e)}",
@@ -619,8 +723,4 @@ async def delete_memory(
             },
             exc_info=True
         )
-        
-        if isinstance(e, HTTPException):
-            raise e
-        
         raise HTTPException(status_code=500, detail=f"Error deleting memory: {str(e)}")
\ No newline at end of file
@@ -1,25 +1,27 @@
-import logging
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.database import get_db
+from app.database import get_db, is_uuid
 from app.get_api_key import get_api_key
 from app.models import MilestoneLog
 
 router = APIRouter()
 
+# Plain column rows rather than MilestoneLog instances: the response only
+# needs the values, so skip ORM object construction and the identity map
+USER_MILESTONES = select(*MilestoneLog.__table__.c).where(
+    MilestoneLog.user_id == bindparam("user_id")
+).order_by(MilestoneLog.created_at.desc())
+
 @router.get("/milestones/{user_id}")
 async def get_milestones(user_id: str, db: AsyncSession = Depends(get_db), api_key: str = Depends(get_api_key)):
-    try:
-        milestones = await db.execute(
-            select(MilestoneLog).where(MilestoneLog.user_id == user_id).order_by(MilestoneLog.timestamp.desc())
-        )
-        return {
-            "status": "ok",
-            "milestones": [m.__dict__ for m in milestones.scalars()]
-        }
-    except Exception as e:
-        logging.error(f"Error fetching milestones: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    if not is_uuid(user_id):
+        # Can't match any user; don't send it to the database
+        return {"status": "ok", "milestones": []}
+    milestones = await db.execute(USER_MILESTONES, {"user_id": user_id})
+    return {
+        "status": "ok",
+        "milestones": [dict(m) for m in milestones.mappings()]
+    }
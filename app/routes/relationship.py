@@ -0,0 +1,68 @@
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.error_handlers import ConflictError, NotFoundError
+from app.get_api_key import get_api_key
+from app.models import Relationship, RelationshipType, VisibilityLevel, gen_ids
+
+router = APIRouter()
+
+class RelationshipInput(BaseModel):
+    # Parsed as UUIDs so malformed ids are rejected with a 422
+    user_a_id: uuid.UUID
+    user_b_id: uuid.UUID
+    relationship_type: RelationshipType
+    approved: bool = False
+    visibility_level: VisibilityLevel = VisibilityLevel.summary
+    visibility_rules: Dict[str, Any] = {}
+    notes: Optional[str] = None
+
+class CreateRelationshipsInput(BaseModel):
+    relationships: List[RelationshipInput]
+
+@router.post("/create-relationships")
+async def create_relationships(data: CreateRelationshipsInput, db: AsyncSession = Depends(get_db), api_key: str = Depends(get_api_key)):
+    if not data.relationships:
+        return {"status": "ok", "ids": []}
+
+    ids = gen_ids(len(data.relationships))
+    payloads = [
+        {
+            "id": new_id,
+            "user_a_id": str(r.user_a_id),
+            "user_b_id": str(r.user_b_id),
+            "relationship_type": r.relationship_type,
+            "approved": r.approved,
+            "visibility_level": r.visibility_level,
+            "visibility_rules": r.visibility_rules,
+            "notes": r.notes
+        }
+        for new_id, r in zip(ids, data.relationships, strict=True)
+    ]
+
+    # One multi-row INSERT instead of a round-trip per relationship; ids are
+    # generated up front, so nothing needs to be returned
+    try:
+        await db.execute(insert(Relationship), payloads)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        pgcode = getattr(e.orig, "pgcode", None)
+        # The driver's own error (asyncpg) carries the violated constraint
+        constraint = getattr(e.orig.__cause__, "constraint_name", None)
+        # 23503: foreign_key_violation
+        if pgcode == "23503":
+            raise NotFoundError("User not found") from e
+        # 23505: unique_violation; the pair already has this relationship
+        # type, in either direction
+        if pgcode == "23505" and constraint == "uix_relationship_pair":
+            raise ConflictError("A relationship of this type already exists between these users") from e
+        raise
+    return {"status": "ok", "ids": ids}
@@ -15,12 +15,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import or_, and_
 
+from app.cache import TTLCache
+from app.database import get_user
 from app.logging_config import get_logger
-from app.models import User
 
 # Configure logger
 logger = get_logger(__name__)
 
+# Lookups of known keys are cached for a short time; entries are keyed by a
+# digest so the cache doesn't hold plaintext keys
+API_KEY_CACHE_TTL = 60
+_key_info_cache = TTLCache(maxsize=1024, ttl=API_KEY_CACHE_TTL)
+
+def _info_cache_key(api_key: str) -> bytes:
+    """Cache key for an API key's looked-up info"""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
 # Define a model for API keys
 # In a real application, this would be a SQLAlchemy model
 class ApiKeyStore:
@@ -90,7 +100,7 @@ async def generate_api_key(
         Tuple of (api_key, key_data)
     """
     # Verify user exists
-    user = await db.get(User, user_id)
+    user = await get_user(db, user_id)
     if not user:
         logger.error(
             "Failed to generate API key: user not found",
@@ -151,12 +161,20 @@ async def get_api_key_info(api_key: str, db: AsyncSession) -> Optional[Dict[str,
     Returns:
         Key data if found, otherwise None
     """
+    cache_key = _info_cache_key(api_key)
+    cached = _key_info_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     # In a real implementation, this would query a database
-    key_data = await ApiKeyStore.get_key(api_key)
+    stored = await ApiKeyStore.get_key(api_key)
     
-    if not key_data:
+    if not stored:
         return None
     
+    # Parse dates on a copy so the stored record keeps its ISO strings
+    key_data = dict(stored)
+    
     # Convert expires_at from string to datetime if it exists
     if key_data.get("expires_at"):
         key_data["expires_at"] = datetime.fromisoformat(key_data["expires_at"])
@@ -165,6 +183,7 @@ async def get_api_key_info(api_key: str, db: AsyncSession) -> Optional[Dict[str,
     if key_data.get("created_at"):
         key_data["created_at"] = datetime.fromisoformat(key_data["created_at"])
     
+    _key_info_cache.set(cache_key, key_data)
     return key_data
 
 async def get_user_api_keys(user_id: str, db: AsyncSession) -> List[Dict[str, Any]]:
@@ -216,6 +235,7 @@ async def revoke_api_key(api_key: str, db: AsyncSession) -> bool:
     
     # Update key data
     result = await ApiKeyStore.update_key(api_key, {"is_active": False})
+    _key_info_cache.delete(_info_cache_key(api_key))
     
     if result:
         logger.info(
@@ -257,6 +277,7 @@ async def update_api_key_scopes(
     # Update key data
     old_scopes = key_data.get("scopes", [])
     result = await ApiKeyStore.update_key(api_key, {"scopes": scopes})
+    _key_info_cache.delete(_info_cache_key(api_key))
     
     if result:
         logger.info(
@@ -6,6 +6,7 @@ This module provides authentication mechanisms for the application.
 
 import logging
 import json
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, Union, List
 
@@ -13,11 +14,11 @@ from fastapi import Depends, HTTPException, status, Request, Security
 from fastapi.security import OAuth2PasswordBearer, APIKeyHeader, SecurityScopes
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.database import get_db
+from app.database import USER_LOAD_OPTIONS, get_db, get_user
 from app.models import User
 from app.logging_config import get_logger
 
@@ -54,10 +55,11 @@ class Token(BaseModel):
     user_id: str
     scopes: List[str]
 
-class TokenData(BaseModel):
-    """Token data model"""
+@dataclass(slots=True, frozen=True)
+class TokenData:
+    """Token data decoded from a verified JWT"""
     username: Optional[str] = None
-    scopes: List[str] = []
+    scopes: List[str] = field(default_factory=list)
     user_id: Optional[str] = None
     exp: Optional[datetime] = None
 
@@ -117,7 +119,7 @@ async def authenticate_user(
     db: AsyncSession
 ) -> Optional[User]:
     """Authenticate a user with username and password"""
-    query = select(User).where(User.email == username.lower())
+    query = select(User).where(User.email == username.strip()).options(*USER_LOAD_OPTIONS)
     result = await db.execute(query)
     user = result.scalars().first()
     
@@ -257,7 +259,7 @@ async def get_current_user(
             exp=datetime.fromtimestamp(payload.get("exp", 0))
         )
         
-    except (JWTError, ValidationError) as e:
+    except JWTError as e:
         logger.warning(
             f"JWT validation failed: {str(e)}",
             exc_info=True
@@ -265,7 +267,7 @@ async def get_current_user(
         raise credentials_exception
     
     # Get the user from database
-    user = await db.get(User, token_data.user_id)
+    user = await get_user(db, token_data.user_id)
     
     if user is None or not user.is_active:
         logger.warning(
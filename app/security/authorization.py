@@ -10,11 +10,13 @@ from typing import Dict, List, Set, Optional, Any, Union
 from datetime import datetime
 
 from fastapi import HTTPException, status, Depends
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models import User, MemoryAccessLevel, Memory
-from app.database import get_db
+from app.database import get_db, get_user
 from app.logging_config import get_logger
 from app.security.authentication import get_current_user
 
@@ -68,7 +70,7 @@ class AuthorizationService:
             True if the user has the permission, False otherwise
         """
         # Get user
-        user = await db.get(User, user_id)
+        user = await get_user(db, user_id)
         if not user:
             logger.warning(
                 "Authorization check for nonexistent user",
@@ -220,15 +222,15 @@ class AuthorizationService:
         # Check relationships
         from app.models import Relationship, RelationshipType, VisibilityLevel
         
-        # Look for a relationship between the users
+        # Look for a relationship between the users, in either direction
+        pair = (
+            literal(user_id, UUID(as_uuid=False)),
+            literal(target_user_id, UUID(as_uuid=False))
+        )
         query = select(Relationship).where(
-            (
-                ((Relationship.user_a_id == user_id) & 
-                 (Relationship.user_b_id == target_user_id)) |
-                ((Relationship.user_a_id == target_user_id) & 
-                 (Relationship.user_b_id == user_id))
-            ) &
-            (Relationship.approved == True)
+            Relationship.user_low == func.least(*pair),
+            Relationship.user_high == func.greatest(*pair),
+            Relationship.approved == True
         )
         
         result = await db.execute(query)
@@ -336,7 +338,7 @@ class AuthorizationService:
             return True
             
         # Only admins can modify agents
-        user = await db.get(User, user_id)
+        user = await get_user(db, user_id)
         if user and user.role == "admin":
             return True
             
@@ -8,6 +8,8 @@ import base64
 import logging
 import os
 from typing import Union, Dict, Any, Optional
+
+import orjson
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -91,8 +93,8 @@ class EncryptionService:
         try:
             # Convert data to bytes
             if isinstance(data, dict):
-                import json
-                data_bytes = json.dumps(data).encode()
+                # Compact UTF-8 JSON; nobody reads the plaintext but the decrypter
+                data_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
             elif isinstance(data, str):
                 data_bytes = data.encode()
             else:
@@ -126,15 +128,12 @@ class EncryptionService:
             # Decrypt data
             decrypted_bytes = self.cipher.decrypt(encrypted_bytes)
             
-            # Convert to string
-            decrypted_str = decrypted_bytes.decode()
-            
             # Parse as JSON if requested
             if as_json:
-                import json
-                return json.loads(decrypted_str)
+                return orjson.loads(decrypted_bytes)
                 
-            return decrypted_str
+            # Convert to string
+            return decrypted_bytes.decode()
             
         except Exception as e:
             logger.error(f"Decryption error: {str(e)}", exc_info=True)
@@ -6,9 +6,12 @@ This module provides rate limiting functionality to protect API endpoints.
 
 import time
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any, Callable
 from fastapi import Request, HTTPException, status, Depends
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.logging_config import get_logger
 
@@ -28,7 +31,7 @@ class RateLimiter:
         """
         self.limit = limit
         self.window_seconds = window_seconds
-        self.requests = {}  # client_key -> [(timestamp, count), ...]
+        self.requests: Dict[str, deque] = {}  # client_key -> deque of request timestamps, oldest first
     
     def _clean_old_requests(self, client_key: str, now: float) -> None:
         """
@@ -38,15 +41,14 @@ class RateLimiter:
             client_key: Client identifier
             now: Current timestamp
         """
-        if client_key not in self.requests:
+        timestamps = self.requests.get(client_key)
+        if timestamps is None:
             return
             
-        # Remove entries older than the window
+        # Pop entries older than the window from the left
         window_start = now - self.window_seconds
-        self.requests[client_key] = [
-            (ts, count) for ts, count in self.requests[client_key]
-            if ts >= window_start
-        ]
+        while timestamps and timestamps[0] < window_start:
+            timestamps.popleft()
     
     def is_allowed(self, client_key: str) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -65,7 +67,7 @@ class RateLimiter:
         
         # Initialize client record if not exists
         if client_key not in self.requests:
-            self.requests[client_key] = [(now, 1)]
+            self.requests[client_key] = deque((now,))
             return True, {
                 "limit": self.limit,
                 "remaining": self.limit - 1,
@@ -73,13 +75,13 @@ class RateLimiter:
             }
         
         # Count total requests in the window
-        total_requests = sum(count for _, count in self.requests[client_key])
+        timestamps = self.requests[client_key]
+        total_requests = len(timestamps)
         
         # Check if limit is exceeded
         if total_requests >= self.limit:
-            # Get reset time
-            oldest_ts = min(ts for ts, _ in self.requests[client_key])
-            reset_time = oldest_ts + self.window_seconds
+            # Get reset time from the oldest request in the window
+            reset_time = timestamps[0] + self.window_seconds
             
             return False, {
                 "limit": self.limit,
@@ -88,7 +90,7 @@ class RateLimiter:
             }
         
         # Add current request
-        self.requests[client_key].append((now, 1))
+        timestamps.append(now)
         
         # Calculate remaining
         remaining = self.limit - total_requests - 1
@@ -186,28 +188,34 @@ async def rate_limit_dependency(
             }
         )
 
-# Middleware for adding rate limit headers to responses
-async def add_rate_limit_headers(request: Request, call_next):
+class RateLimitHeadersMiddleware:
     """
-    Middleware for adding rate limit headers to responses.
-    
-    Args:
-        request: FastAPI request object
-        call_next: Next middleware function
-        
-    Returns:
-        Response with rate limit headers
+    Pure ASGI middleware adding rate limit headers to responses
+
+    The headers are taken from the rate limit info that rate_limit_dependency
+    stores on request.state (scope["state"]); responses of routes without
+    the dependency pass through unchanged.
     """
-    response = await call_next(request)
-    
-    # Add rate limit headers if available
-    if hasattr(request.state, "rate_limit_info"):
-        rate_limit_info = request.state.rate_limit_info
-        response.headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(rate_limit_info["remaining"])
-        response.headers["X-RateLimit-Reset"] = str(int(rate_limit_info["reset"]))
-    
-    return response
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                rate_limit_info = scope.get("state", {}).get("rate_limit_info")
+                if rate_limit_info is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
+                    headers["X-RateLimit-Remaining"] = str(rate_limit_info["remaining"])
+                    headers["X-RateLimit-Reset"] = str(int(rate_limit_info["reset"]))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 # Helper function to create a rate-limited route
 def rate_limited(limiter_key: str = "default"):